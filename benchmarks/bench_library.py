@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Library Benchmark Suite
+
+Builds synthetic libraries with the real schema (core/library/schema) and:
+
+- checks EXPLAIN QUERY PLAN for every hot query: no full table scan and no
+  temp B-tree sort (fails with exit 1 otherwise)
+- times every operation in core/library/examples/demo_library.py, with the
+  demo's output suppressed, plus the tag queries in tag_queries.py (SQL and
+  TagBitmapCache)
+
+`search_entries` is the one allowed scan: `LIKE '%term%'` has a leading
+wildcard, so no B-tree index can serve it. The plan must still walk
+idx_entry_created so ORDER BY created_at needs no sort. Tag queries may use
+temp B-trees (INTERSECT, GROUP BY, ORDER BY) - they hold only the rows found
+by index seeks - but must not scan a table.
+
+Usage:
+    python benchmarks/bench_library.py                       # 10k, 100k, 1M
+    python benchmarks/bench_library.py --sizes 10000 --plans-only
+"""
+
+import argparse
+import contextlib
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'core/library/examples'))
+
+import demo_library  # noqa: E402
+import library_sync  # noqa: E402
+import tag_queries  # noqa: E402
+
+ENTRY_TYPES = ('knowledge', 'decision', 'pattern', 'achievement', 'als')
+RELATIONSHIP_TYPES = ('relates_to', 'implements', 'supersedes', 'depends_on')
+WORDS = (
+    'library pattern decision inbox routing model cost quality sync export schema index '
+    'tag entry graph protocol learning achievement memory context agent workflow cache'
+).split()
+TAGS = [f"tag-{i:03d}" for i in range(200)]
+TAGS_PER_ENTRY = 3
+LINKS_PER_ENTRY = 2
+SEARCH_TERM = 'needle'   # planted in ~0.1% of entries
+
+# name, SQL, params (from the synthetic data), allowed full scan (reason) or None
+HOT_QUERIES = [
+    ('search_entries', demo_library.SEARCH_SQL, ('%needle%', '%needle%'),
+     "leading-wildcard LIKE cannot use a B-tree index"),
+    ('get_related_entries', demo_library.RELATED_SQL, ('E-0000001',), None),
+    ('library_statistics', demo_library.STATS_SQL, (), None),
+    ('entries_by_type',
+     "SELECT entry_id, title FROM library_entries WHERE entry_type = ? "
+     "ORDER BY created_at DESC LIMIT 20",
+     ('decision',), None),
+    ('entries_with_tag',
+     "SELECT e.entry_id, e.title FROM tags t JOIN library_entries e ON e.entry_id = t.entry_id "
+     "WHERE t.tag = ?",
+     ('tag-007',), None),
+    ('tags_for_entry', "SELECT tag FROM tags WHERE entry_id = ?", ('E-0000001',), None),
+    ('backlinks',
+     "SELECT from_entry_id, relationship_type FROM entry_relationships WHERE to_entry_id = ?",
+     ('E-0000001',), None),
+    ('get_entry', "SELECT * FROM library_entries WHERE entry_id = ?", ('E-0000001',), None),
+    ('sync_since', library_sync.SYNC_COALESCED_SQL, (0,), None),
+]
+
+# name, function(conn, cache) - timed; SQL plans captured via the connection trace
+TAG_TAGS = ['tag-001', 'tag-002']
+TAG_QUERIES = [
+    ('entries_with_all_tags', lambda conn, cache: tag_queries.entries_with_all_tags(conn, TAG_TAGS)),
+    ('entries_with_any_tag', lambda conn, cache: tag_queries.entries_with_any_tag(conn, TAG_TAGS, 50)),
+    ('facet_counts', lambda conn, cache: tag_queries.facet_counts(conn, TAG_TAGS)),
+    ('facet_counts_all', lambda conn, cache: tag_queries.facet_counts(conn)),
+    ('bitmap_all_of_count', lambda conn, cache: cache.count(cache.all_of(TAG_TAGS))),
+    ('bitmap_all_of_entries', lambda conn, cache: cache.entries(cache.all_of(TAG_TAGS))),
+    ('bitmap_facet_counts', lambda conn, cache: cache.facet_counts(TAG_TAGS, facet_tags())),
+]
+
+
+def facet_tags():
+    """Hot tags counted by bitmap_facet_counts"""
+    return [t for t in TAGS[:64] if t not in TAG_TAGS]
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+# ---------------------------------------------------------------------------
+
+def entry_id(i: int) -> str:
+    return f"E-{i:07d}"
+
+
+def build_library(db_path, size: int, seed: int = 8825) -> sqlite3.Connection:
+    """Create a library with `size` entries, ~3 tags and ~2 links each"""
+    with contextlib.redirect_stdout(open(os.devnull, 'w')):
+        conn = demo_library.init_database(str(db_path))
+
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    step = timedelta(days=730) / size
+
+    def entries():
+        for i in range(size):
+            words = rng.choices(WORDS, k=12)
+            if i % 1000 == 7:
+                words[rng.randrange(12)] = SEARCH_TERM
+            created = (start + step * rng.randrange(size)).isoformat()
+            yield (entry_id(i), ENTRY_TYPES[i % len(ENTRY_TYPES)], ' '.join(words[:4]).title(),
+                   ' '.join(words), round(rng.random(), 2), created, created)
+
+    def tags():
+        for i in range(size):
+            for tag in rng.sample(TAGS, TAGS_PER_ENTRY):
+                yield (entry_id(i), tag)
+
+    def links():
+        for i in range(size):
+            for _ in range(LINKS_PER_ENTRY):
+                yield (entry_id(i), entry_id(rng.randrange(size)), rng.choice(RELATIONSHIP_TYPES),
+                       start.isoformat())
+
+    with conn:
+        conn.executemany(
+            "INSERT INTO library_entries (entry_id, entry_type, title, content, confidence, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)", entries())
+        conn.executemany("INSERT OR IGNORE INTO tags (entry_id, tag) VALUES (?, ?)", tags())
+        conn.executemany(
+            "INSERT OR IGNORE INTO entry_relationships (from_entry_id, to_entry_id, "
+            "relationship_type, created_at) VALUES (?, ?, ?, ?)", links())
+    return conn
+
+
+# ---------------------------------------------------------------------------
+# Query plans
+# ---------------------------------------------------------------------------
+
+def plan_violations(conn, sql: str, params, scan_reason):
+    """EXPLAIN QUERY PLAN details that break the no-scan / no-sort rule"""
+    details = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+    bad = []
+    for detail in details:
+        if 'TEMP B-TREE' in detail:
+            bad.append(detail)
+        elif detail.startswith('SCAN ') and 'COVERING INDEX' not in detail and scan_reason is None:
+            bad.append(detail)
+        elif detail.startswith('SCAN ') and scan_reason is not None and 'USING INDEX' not in detail:
+            # allowed scan must at least walk the ORDER BY index
+            bad.append(detail)
+    return details, bad
+
+
+def captured_sql(conn, fn):
+    """SQL statements (with bound values inlined) run by fn(conn)"""
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        fn(conn)
+    finally:
+        conn.set_trace_callback(None)
+    return [sql for sql in statements if sql.lstrip().upper().startswith('SELECT')]
+
+
+def check_plans(conn) -> bool:
+    print("  Query plans:")
+    ok = True
+    for name, sql, params, scan_reason in HOT_QUERIES:
+        details, bad = plan_violations(conn, sql, params, scan_reason)
+        ok = ok and not bad
+        status = '❌' if bad else ('⚠️ ' if scan_reason else '✅')
+        print(f"    {status} {name:<22} {' | '.join(details)}")
+        if scan_reason and not bad:
+            print(f"       (scan allowed: {scan_reason})")
+
+    for name, fn in TAG_QUERIES:
+        if name.startswith('bitmap_'):
+            continue
+        for sql in captured_sql(conn, lambda c: fn(c, None)):
+            details, bad = plan_violations(conn, sql, (), None)
+            bad = [d for d in bad if 'TEMP B-TREE' not in d]
+            ok = ok and not bad
+            seeks = [d for d in details if d.startswith(('SEARCH', 'SCAN'))]
+            print(f"    {'❌' if bad else '✅'} {name:<22} {' | '.join(seeks)}")
+    return ok
+
+
+# ---------------------------------------------------------------------------
+# Timings
+# ---------------------------------------------------------------------------
+
+def time_op(fn, reps: int):
+    """Median ms per call"""
+    samples = []
+    for i in range(reps):
+        start = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def time_demo_operations(conn, size: int, workdir: Path, reps: int, export: bool):
+    """Median ms of each demo_library operation against a populated library"""
+    rng = random.Random(size)
+    results = {}
+
+    def lookup_id(_):
+        return entry_id(rng.randrange(size))
+
+    ops = [
+        ('insert_knowledge', lambda i: demo_library.insert_knowledge(
+            conn, f"K-BENCH-{i:05d}", 'Bench knowledge', 'Synthetic knowledge entry', 0.8)),
+        ('insert_decision', lambda i: demo_library.insert_decision(
+            conn, f"D-BENCH-{i:05d}", 'Bench decision', 'Synthetic decision entry', 'benchmark')),
+        ('add_tag', lambda i: demo_library.add_tag(conn, lookup_id(i), f"bench-{i:05d}")),
+        ('link_entries', lambda i: demo_library.link_entries(
+            conn, lookup_id(i), lookup_id(i), f"bench_{i:05d}")),
+        ('search_entries', lambda i: demo_library.search_entries(conn, SEARCH_TERM)),
+        ('get_related_entries', lambda i: demo_library.get_related_entries(conn, lookup_id(i))),
+        ('library_statistics', lambda i: conn.execute(demo_library.STATS_SQL).fetchall()),
+        # the last 100 changes, as a peer pulling regularly would
+        ('sync_since', lambda i: library_sync.sync_since(conn, library_sync.current_seq(conn) - 100)),
+    ]
+    for name, sql, params, _ in HOT_QUERIES:
+        if name not in dict(ops) and name != 'get_entry':
+            ops.append((name, lambda i, sql=sql, params=params: conn.execute(sql, params).fetchall()))
+    ops.append(('get_entry', lambda i: conn.execute(
+        "SELECT * FROM library_entries WHERE entry_id = ?", (lookup_id(i),)).fetchall()))
+
+    cache = tag_queries.TagBitmapCache(conn)
+    start = time.perf_counter()
+    cache.all_of(TAG_TAGS)
+    cache.facet_counts(TAG_TAGS, facet_tags())
+    results['bitmap_cache_warmup'] = (time.perf_counter() - start) * 1000
+    for name, fn in TAG_QUERIES:
+        ops.append((name, lambda i, fn=fn: fn(conn, cache)))
+
+    with contextlib.redirect_stdout(open(os.devnull, 'w')):
+        for name, fn in ops:
+            op_reps = reps if name != 'search_entries' else max(3, reps // 10)
+            results[name] = time_op(fn, op_reps)
+        if export:
+            results['export_to_json'] = time_op(
+                lambda i: demo_library.export_to_json(conn, str(workdir / 'export.json')), 1)
+    return results
+
+
+def run_size(size: int, reps: int, plans_only: bool, export: bool) -> bool:
+    print(f"\n📚 {size:,} entries")
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        start = time.perf_counter()
+        conn = build_library(workdir / 'bench_library.db', size)
+        print(f"  Built in {time.perf_counter() - start:.1f}s "
+              f"({(workdir / 'bench_library.db').stat().st_size / 1e6:.0f} MB)")
+
+        ok = check_plans(conn)
+
+        if not plans_only:
+            print("  Operations (median ms):")
+            for name, ms in time_demo_operations(conn, size, workdir, reps, export).items():
+                print(f"    {name:<24} {ms:10.3f}")
+        conn.close()
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Library query plan checks and operation timings")
+    parser.add_argument('--sizes', default='10000,100000,1000000',
+                        help="Comma-separated library sizes (default: 10k,100k,1M)")
+    parser.add_argument('--reps', type=int, default=200, help="Repetitions per timed operation")
+    parser.add_argument('--plans-only', action='store_true', help="Only check query plans")
+    parser.add_argument('--no-export', action='store_true', help="Skip the export_to_json timing")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    print(f"\n⏱  Library benchmark (SQLite {sqlite3.sqlite_version})")
+
+    results = [run_size(size, args.reps, args.plans_only, not args.no_export) for size in sizes]
+
+    print()
+    if not all(results):
+        print("❌ Hot query plan regression (full scan or temp B-tree)")
+        sys.exit(1)
+    print("✅ All hot queries use indexes")
+
+
+if __name__ == '__main__':
+    main()
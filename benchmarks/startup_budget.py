@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Startup Budget Benchmark
+
+Cold-start check for the CLI entry points launched from hotkeys and scripts.
+Uses `python -X importtime` to measure each entry module's cumulative import
+time and the set of modules it pulls in (modules already loaded by site or
+.pth files at interpreter startup are not counted), and fails (exit 1) when:
+
+- import time (median of N runs) exceeds the entry point's budget, or
+- a heavy module that must stay lazy (docx, lxml, subprocess, ...) is
+  imported at startup
+
+Usage:
+    python benchmarks/startup_budget.py
+    python benchmarks/startup_budget.py --runs 9 --scale 2.0   # slower machines / CI
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# name, directory, module, import budget (ms), modules that must not load at startup
+ENTRY_POINTS = [
+    (
+        'post_meeting_capture',
+        REPO_ROOT / 'shared/automations/tgif/processors',
+        'post_meeting_capture',
+        40,
+        {'subprocess', 'json', 'note_renderers', 'typing'},
+    ),
+    (
+        'minimal_meeting_processor',
+        REPO_ROOT / 'shared/automations/tgif/processors',
+        'minimal_meeting_processor',
+        50,
+        {'subprocess', 'email', 'cProfile', 'tracemalloc'},
+    ),
+    (
+        'template_word_generator_v2',
+        REPO_ROOT / 'tools/template_word_generator',
+        'template_word_generator_v2',
+        50,
+        {'docx', 'lxml', 'concurrent.futures', 'multiprocessing', 'cProfile', 'tracemalloc'},
+    ),
+]
+
+
+def measure_import(directory: Path, module: str):
+    """Return (cumulative import us of module, set of imported module names)"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=directory, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    # Children are printed before their parent, indented one level deeper.
+    # Only the block ending at the module's own top-level line counts:
+    # modules loaded earlier by site / .pth files are not the entry's cost.
+    cumulative_us = None
+    imported = set()
+    pending = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, field = line.split('|', 2)
+        name = field.strip()
+        pending.add(name)
+        if field[1:2] != ' ':   # top level: a single space before the name
+            if name == module:
+                cumulative_us = int(cumulative.strip())
+                imported = pending
+                break
+            pending = set()
+
+    if cumulative_us is None:
+        raise RuntimeError(f"No importtime entry for {module}")
+    return cumulative_us, imported
+
+
+def check_entry_point(name, directory, module, budget_ms, forbidden, runs, scale):
+    """Print one result line; return True if within budget"""
+    # Warm-up run writes .pyc files so we measure cold start, not compilation
+    measure_import(directory, module)
+
+    samples = []
+    imported = set()
+    for _ in range(runs):
+        cumulative_us, imported = measure_import(directory, module)
+        samples.append(cumulative_us / 1000)
+
+    median_ms = statistics.median(samples)
+    limit_ms = budget_ms * scale
+    leaked = sorted(f for f in forbidden if any(m == f or m.startswith(f + '.') for m in imported))
+
+    ok = median_ms <= limit_ms and not leaked
+    status = '✅' if ok else '❌'
+    print(f"  {status} {name:<28} {median_ms:7.1f} ms  (budget {limit_ms:.0f} ms, {len(imported)} modules)")
+    if leaked:
+        print(f"       heavy modules imported at startup: {', '.join(leaked)}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check CLI cold-start import budgets")
+    parser.add_argument('--runs', type=int, default=5, help="Measured runs per entry point (median)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Multiply all budgets (e.g. 2.0 on slow CI runners)")
+    args = parser.parse_args()
+
+    print(f"\n⏱  Startup budget (python -X importtime, median of {args.runs})\n")
+
+    results = [
+        check_entry_point(name, directory, module, budget, forbidden, args.runs, args.scale)
+        for name, directory, module, budget, forbidden in ENTRY_POINTS
+    ]
+
+    print()
+    if not all(results):
+        print("❌ Startup budget exceeded")
+        sys.exit(1)
+    print("✅ All entry points within budget")
+
+
+if __name__ == '__main__':
+    main()
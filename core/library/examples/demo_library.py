@@ -6,9 +6,38 @@ Demonstrates how to use the 8825 Library system
 
 import sqlite3
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 
+# Opt-in stage timing (PERF_STAGES=1) from shared/perf; no-op stages outside the repo
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "shared" / "perf"))
+    from perf_stages import stage
+except (IndexError, ImportError):
+    _NULL_STAGE = type('NullStage', (), {'__enter__': lambda self: self, '__exit__': lambda self, *exc: None,
+                                         '__call__': lambda self, func: func})()
+    stage = lambda name: _NULL_STAGE  # noqa: E731  (with stage(...) / @stage(...))
+
+# Hot queries (checked with EXPLAIN QUERY PLAN in benchmarks/bench_library.py)
+SEARCH_SQL = """
+    SELECT entry_id, entry_type, title, content
+    FROM library_entries
+    WHERE title LIKE ? OR content LIKE ?
+    ORDER BY created_at DESC
+"""
+
+RELATED_SQL = """
+    SELECT 
+        e.entry_id, e.entry_type, e.title, r.relationship_type
+    FROM entry_relationships r
+    JOIN library_entries e ON r.to_entry_id = e.entry_id
+    WHERE r.from_entry_id = ?
+"""
+
+STATS_SQL = "SELECT entry_type, COUNT(*) FROM library_entries GROUP BY entry_type"
+
+@stage('library.init_database')
 def init_database(db_path='demo_library.db'):
     """Initialize a new library database"""
     # Get schema path relative to this file
@@ -29,6 +58,7 @@ def init_database(db_path='demo_library.db'):
     print(f"✅ Database initialized: {db_path}")
     return conn
 
+@stage('library.insert_knowledge')
 def insert_knowledge(conn, entry_id, title, content, confidence=0.9):
     """Insert a knowledge entry"""
     cursor = conn.cursor()
@@ -46,6 +76,7 @@ def insert_knowledge(conn, entry_id, title, content, confidence=0.9):
     conn.commit()
     print(f"✅ Inserted: {entry_id} - {title}")
 
+@stage('library.insert_decision')
 def insert_decision(conn, entry_id, title, content, rationale):
     """Insert a decision entry"""
     cursor = conn.cursor()
@@ -65,6 +96,7 @@ def insert_decision(conn, entry_id, title, content, rationale):
     conn.commit()
     print(f"✅ Inserted: {entry_id} - {title}")
 
+@stage('library.add_tag')
 def add_tag(conn, entry_id, tag):
     """Add a tag to an entry"""
     cursor = conn.cursor()
@@ -76,6 +108,7 @@ def add_tag(conn, entry_id, tag):
     conn.commit()
     print(f"✅ Tagged {entry_id} with: {tag}")
 
+@stage('library.link_entries')
 def link_entries(conn, from_id, to_id, relationship_type='relates_to'):
     """Create a relationship between entries"""
     cursor = conn.cursor()
@@ -88,16 +121,12 @@ def link_entries(conn, from_id, to_id, relationship_type='relates_to'):
     conn.commit()
     print(f"✅ Linked {from_id} → {to_id} ({relationship_type})")
 
+@stage('library.search_entries')
 def search_entries(conn, search_term):
     """Search for entries"""
     cursor = conn.cursor()
     
-    cursor.execute("""
-        SELECT entry_id, entry_type, title, content
-        FROM library_entries
-        WHERE title LIKE ? OR content LIKE ?
-        ORDER BY created_at DESC
-    """, (f'%{search_term}%', f'%{search_term}%'))
+    cursor.execute(SEARCH_SQL, (f'%{search_term}%', f'%{search_term}%'))
     
     results = cursor.fetchall()
     
@@ -108,17 +137,12 @@ def search_entries(conn, search_term):
     
     return results
 
+@stage('library.get_related_entries')
 def get_related_entries(conn, entry_id):
     """Get entries related to this one"""
     cursor = conn.cursor()
     
-    cursor.execute("""
-        SELECT 
-            e.entry_id, e.entry_type, e.title, r.relationship_type
-        FROM entry_relationships r
-        JOIN library_entries e ON r.to_entry_id = e.entry_id
-        WHERE r.from_entry_id = ?
-    """, (entry_id,))
+    cursor.execute(RELATED_SQL, (entry_id,))
     
     results = cursor.fetchall()
     
@@ -128,6 +152,7 @@ def get_related_entries(conn, entry_id):
     
     return results
 
+@stage('library.export_to_json')
 def export_to_json(conn, output_file='library_export.json'):
     """Export all entries to JSON"""
     cursor = conn.cursor()
@@ -219,7 +244,7 @@ def main():
     
     # Stats
     cursor = conn.cursor()
-    cursor.execute("SELECT entry_type, COUNT(*) FROM library_entries GROUP BY entry_type")
+    cursor.execute(STATS_SQL)
     stats = cursor.fetchall()
     
     print("📊 Library Statistics:")
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Library Sync - Change Feed and Incremental Sync
+Exchange only what changed between two 8825 Library databases
+
+Triggers on library_entries, tags and entry_relationships append every
+change to change_log with a monotonically increasing seq. A machine asks
+a peer for sync_since(last_seq), applies the delta with apply_delta, and
+remembers the peer's seq for next time - no full export needed.
+
+Merge rules:
+- library_entries: last writer wins on updated_at (ties take the remote row)
+- tags / relationships: set semantics (insert if missing, delete if present)
+- deletes always apply
+- parents before children: entry upserts, then tag/relationship changes,
+  then entry deletes (safe with PRAGMA foreign_keys=ON)
+
+Usage:
+    python library_sync.py status laptop.db
+    python library_sync.py export laptop.db --since 120 -o delta.json
+    python library_sync.py apply desktop.db delta.json --peer laptop
+    python library_sync.py pull desktop.db laptop.db        # export + apply, remembers seq
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Opt-in stage timing (PERF_STAGES=1) from shared/perf; no-op stages outside the repo
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "shared" / "perf"))
+    from perf_stages import stage
+except (IndexError, ImportError):
+    _NULL_STAGE = type('NullStage', (), {'__enter__': lambda self: self, '__exit__': lambda self, *exc: None,
+                                         '__call__': lambda self, func: func})()
+    stage = lambda name: _NULL_STAGE  # noqa: E731  (with stage(...) / @stage(...))
+
+PEER_KEY = 'sync_peer:{}'
+PRUNED_KEY = 'change_log_pruned_seq'
+
+SYNC_SQL = "SELECT seq, table_name, op, row_key, payload FROM change_log WHERE seq > ? ORDER BY seq"
+
+# Last change per row: no later change to the same row exists
+# (probed on idx_change_log_row, so no temp B-tree for a GROUP BY)
+SYNC_COALESCED_SQL = """
+    SELECT seq, table_name, op, row_key, payload FROM change_log c
+    WHERE c.seq > ?
+      AND NOT EXISTS (
+          SELECT 1 FROM change_log n
+          WHERE n.table_name = c.table_name AND n.row_key = c.row_key AND n.seq > c.seq
+      )
+    ORDER BY c.seq
+"""
+
+_ENTRY_COLUMNS = ('entry_id', 'entry_type', 'title', 'content', 'metadata',
+                  'confidence', 'created_at', 'updated_at')
+
+_UPSERT_ENTRY = f"""
+    INSERT INTO library_entries ({', '.join(_ENTRY_COLUMNS)})
+    VALUES ({', '.join(':' + c for c in _ENTRY_COLUMNS)})
+    ON CONFLICT(entry_id) DO UPDATE SET
+        {', '.join(f'{c} = excluded.{c}' for c in _ENTRY_COLUMNS[1:])}
+    WHERE excluded.updated_at >= library_entries.updated_at
+"""
+
+
+class ResyncRequired(ValueError):
+    """The change log no longer reaches back to the requested seq (pruned)"""
+
+
+def _metadata(conn, key, default=None):
+    row = conn.execute("SELECT value FROM library_metadata WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else default
+
+
+def current_seq(conn):
+    """Highest change_log seq (the pruned position for an emptied log, else 0)"""
+    logged = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM change_log").fetchone()[0]
+    return max(logged, int(_metadata(conn, PRUNED_KEY, 0)))
+
+
+@stage('library.sync_since')
+def sync_since(conn, seq=0, coalesce=True):
+    """
+    Delta of all changes after `seq`
+
+    With coalesce, only the last change per row is sent (an entry edited ten
+    times travels once). The delta's to_seq is what the receiver stores.
+    Raises ResyncRequired if changes after `seq` have been pruned.
+    """
+    pruned = int(_metadata(conn, PRUNED_KEY, 0))
+    if seq < pruned:
+        raise ResyncRequired(
+            f"Change log pruned up to seq {pruned}; seq {seq} needs a full resync"
+        )
+
+    sql = SYNC_COALESCED_SQL if coalesce else SYNC_SQL
+    changes = [
+        {
+            'seq': row_seq,
+            'table': table,
+            'op': op,
+            'key': json.loads(row_key),
+            'row': json.loads(payload) if payload is not None else None
+        }
+        for row_seq, table, op, row_key, payload in conn.execute(sql, (seq,))
+    ]
+    return {
+        'library_id': _metadata(conn, 'library_id'),
+        'schema_version': _metadata(conn, 'schema_version'),
+        'from_seq': seq,
+        'to_seq': changes[-1]['seq'] if changes else max(seq, 0),
+        'changes': changes
+    }
+
+
+def _apply_order(changes):
+    """
+    Final change per row, parents first
+
+    A coalesced delta is in seq order, which can put a tag before the entry
+    it belongs to (entry inserted, tagged, then updated). Only the last
+    change per row matters, so rows are applied as: entry upserts, child
+    rows (tags, relationships), entry deletes.
+    """
+    latest = {}
+    for change in changes:
+        key = (change['table'], json.dumps(change['key']))
+        latest.pop(key, None)
+        latest[key] = change
+
+    def phase(change):
+        if change['table'] != 'library_entries':
+            return 1
+        return 2 if change['op'] == 'delete' else 0
+
+    return sorted(latest.values(), key=phase)
+
+
+def _apply_change(conn, change):
+    """Apply one change; returns True if it changed the local database"""
+    table, op, key, row = change['table'], change['op'], change['key'], change['row']
+
+    if table == 'library_entries':
+        if op == 'delete':
+            cursor = conn.execute("DELETE FROM library_entries WHERE entry_id = ?", key)
+        else:
+            cursor = conn.execute(_UPSERT_ENTRY, {c: row.get(c) for c in _ENTRY_COLUMNS})
+    elif table == 'tags':
+        if op == 'delete':
+            cursor = conn.execute("DELETE FROM tags WHERE entry_id = ? AND tag = ?", key)
+        else:
+            cursor = conn.execute("INSERT OR IGNORE INTO tags (entry_id, tag) VALUES (?, ?)", key)
+    elif table == 'entry_relationships':
+        if op == 'delete':
+            cursor = conn.execute("""
+                DELETE FROM entry_relationships
+                WHERE from_entry_id = ? AND to_entry_id = ? AND relationship_type = ?
+            """, key)
+        else:
+            cursor = conn.execute("""
+                INSERT OR IGNORE INTO entry_relationships
+                    (from_entry_id, to_entry_id, relationship_type, created_at)
+                VALUES (?, ?, ?, ?)
+            """, (*key, row.get('created_at')))
+    else:
+        raise ValueError(f"Unknown table in delta: {table}")
+
+    return cursor.rowcount > 0
+
+
+@stage('library.apply_delta')
+def apply_delta(conn, delta, peer=None):
+    """
+    Merge a delta from sync_since into this library, in one transaction
+
+    Change-log triggers are suppressed while applying, so the merged rows
+    are not sent back to the peer. With `peer`, the delta's to_seq is
+    stored so the next pull starts there. Returns {'applied': n, 'skipped': n}.
+    """
+    if delta.get('library_id') and delta['library_id'] == _metadata(conn, 'library_id'):
+        raise ValueError("Delta comes from this library")
+
+    stats = Counter(applied=0, skipped=0)
+    with conn:
+        # Foreign keys are checked at commit, not per statement (reset when the transaction ends)
+        conn.execute("PRAGMA defer_foreign_keys = ON")
+        conn.execute("INSERT OR REPLACE INTO library_metadata (key, value) VALUES ('sync_applying', '1')")
+        try:
+            for change in _apply_order(delta['changes']):
+                stats['applied' if _apply_change(conn, change) else 'skipped'] += 1
+            if peer:
+                conn.execute(
+                    "INSERT OR REPLACE INTO library_metadata (key, value) VALUES (?, ?)",
+                    (PEER_KEY.format(peer), str(delta['to_seq']))
+                )
+        finally:
+            conn.execute("DELETE FROM library_metadata WHERE key = 'sync_applying'")
+    return dict(stats)
+
+
+def peer_seq(conn, peer):
+    """Last seq applied from `peer` (0 if never synced)"""
+    return int(_metadata(conn, PEER_KEY.format(peer), 0))
+
+
+def prune_change_log(conn, upto_seq):
+    """
+    Drop changes every peer has already pulled (seq <= upto_seq)
+
+    The pruned position is recorded, so a peer that asks for an older seq
+    gets ResyncRequired instead of a delta with silent gaps.
+    """
+    with conn:
+        pruned = max(int(_metadata(conn, PRUNED_KEY, 0)), upto_seq)
+        conn.execute(
+            "INSERT OR REPLACE INTO library_metadata (key, value) VALUES (?, ?)",
+            (PRUNED_KEY, str(pruned))
+        )
+        return conn.execute("DELETE FROM change_log WHERE seq <= ?", (upto_seq,)).rowcount
+
+
+def pull(conn, remote_conn, peer=None):
+    """Fetch what changed on remote since the last pull and apply it"""
+    peer = peer or _metadata(remote_conn, 'library_id')
+    delta = sync_since(remote_conn, peer_seq(conn, peer))
+    return delta, apply_delta(conn, delta, peer=peer)
+
+
+def _resync_exit(error):
+    print(f"❌ {error}")
+    print("   Copy the full database from the peer instead of an incremental sync")
+    sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental Library sync via the change log")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('status', help="Show log position and known peers")
+    p.add_argument('db')
+
+    p = sub.add_parser('export', help="Write changes after --since as a JSON delta")
+    p.add_argument('db')
+    p.add_argument('--since', type=int, default=0)
+    p.add_argument('--output', '-o', help="Delta file (default: stdout)")
+
+    p = sub.add_parser('apply', help="Merge a JSON delta")
+    p.add_argument('db')
+    p.add_argument('delta')
+    p.add_argument('--peer', help="Remember the delta's to_seq for this peer")
+
+    p = sub.add_parser('pull', help="Export from REMOTE since the last pull and apply to DB")
+    p.add_argument('db')
+    p.add_argument('remote')
+    p.add_argument('--peer', help="Peer name (default: remote library_id)")
+
+    p = sub.add_parser('prune', help="Delete change log entries up to a seq")
+    p.add_argument('db')
+    p.add_argument('upto_seq', type=int)
+
+    args = parser.parse_args()
+    conn = sqlite3.connect(args.db)
+
+    if args.command == 'status':
+        print(f"\n📚 {args.db}")
+        print(f"  library_id: {_metadata(conn, 'library_id')}")
+        print(f"  schema:     {_metadata(conn, 'schema_version')}")
+        print(f"  log seq:    {current_seq(conn)}")
+        print(f"  pruned to:  {_metadata(conn, PRUNED_KEY, 0)}")
+        peers = conn.execute(
+            "SELECT key, value FROM library_metadata WHERE key LIKE 'sync_peer:%' ORDER BY key"
+        ).fetchall()
+        for key, value in peers:
+            print(f"  peer {key.split(':', 1)[1]}: seq {value}")
+        print()
+
+    elif args.command == 'export':
+        try:
+            delta = sync_since(conn, args.since)
+        except ResyncRequired as e:
+            _resync_exit(e)
+        text = json.dumps(delta, indent=2)
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(text)
+            print(f"✅ Exported {len(delta['changes'])} changes "
+                  f"(seq {delta['from_seq']} → {delta['to_seq']}) to {args.output}")
+        else:
+            print(text)
+
+    elif args.command == 'apply':
+        with open(args.delta, 'r') as f:
+            delta = json.load(f)
+        stats = apply_delta(conn, delta, peer=args.peer)
+        print(f"✅ Applied {stats['applied']} changes ({stats['skipped']} already up to date)")
+
+    elif args.command == 'pull':
+        remote = sqlite3.connect(args.remote)
+        try:
+            delta, stats = pull(conn, remote, peer=args.peer)
+        except ResyncRequired as e:
+            _resync_exit(e)
+        finally:
+            remote.close()
+        print(f"✅ Pulled seq {delta['from_seq']} → {delta['to_seq']}: "
+              f"{stats['applied']} applied, {stats['skipped']} already up to date")
+
+    elif args.command == 'prune':
+        print(f"✅ Pruned {prune_change_log(conn, args.upto_seq)} change log entries")
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
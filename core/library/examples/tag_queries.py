@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Tag Queries - Intersection, Union and Facets
+Faceted navigation over the 8825 Library tags table
+
+Each query is a single SQL statement served by the tag indexes
+(tags(tag, entry_id) and UNIQUE(entry_id, tag)). For hot tags,
+TagBitmapCache keeps one bitmap per tag (a Python int, bit = entry rowid),
+so intersections, unions and facet counts are integer AND/OR/popcount.
+
+Usage:
+    python tag_queries.py demo_library.db --all routing cost-optimization
+    python tag_queries.py demo_library.db --any inbox library
+    python tag_queries.py demo_library.db --all dli --facets
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+# Opt-in stage timing (PERF_STAGES=1) from shared/perf; no-op stages outside the repo
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "shared" / "perf"))
+    from perf_stages import stage
+except (IndexError, ImportError):
+    _NULL_STAGE = type('NullStage', (), {'__enter__': lambda self: self, '__exit__': lambda self, *exc: None,
+                                         '__call__': lambda self, func: func})()
+    stage = lambda name: _NULL_STAGE  # noqa: E731  (with stage(...) / @stage(...))
+
+# int.bit_count is 3.10+
+_popcount = getattr(int, 'bit_count', None) or (lambda bits: bin(bits).count('1'))
+
+ENTRY_COLUMNS = "e.entry_id, e.entry_type, e.title"
+
+
+def _intersection_subquery(tags):
+    """SELECT entry_id ... INTERSECT ... - one index seek per tag"""
+    return ' INTERSECT '.join(["SELECT entry_id FROM tags WHERE tag = ?"] * len(tags))
+
+
+def _union_subquery(tags):
+    placeholders = ', '.join('?' * len(tags))
+    return f"SELECT entry_id FROM tags WHERE tag IN ({placeholders})"
+
+
+@stage('library.entries_with_all_tags')
+def entries_with_all_tags(conn, tags, limit=None):
+    """Entries tagged with every tag in `tags`, newest first"""
+    tags = list(tags)
+    if not tags:
+        return []
+    sql = f"""
+        SELECT {ENTRY_COLUMNS}
+        FROM library_entries e
+        WHERE e.entry_id IN ({_intersection_subquery(tags)})
+        ORDER BY e.created_at DESC
+    """
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+    return conn.execute(sql, tags).fetchall()
+
+
+@stage('library.entries_with_any_tag')
+def entries_with_any_tag(conn, tags, limit=None):
+    """Entries tagged with at least one tag in `tags`, newest first"""
+    tags = list(tags)
+    if not tags:
+        return []
+    sql = f"""
+        SELECT {ENTRY_COLUMNS}
+        FROM library_entries e
+        WHERE e.entry_id IN ({_union_subquery(tags)})
+        ORDER BY e.created_at DESC
+    """
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+    return conn.execute(sql, tags).fetchall()
+
+
+@stage('library.facet_counts')
+def facet_counts(conn, tags=(), limit=20):
+    """
+    Tag counts over the entries matching all of `tags`
+
+    With no tags, counts over the whole library. The selected tags
+    themselves are left out. Returns [(tag, count)], most common first.
+    """
+    tags = list(tags)
+    if not tags:
+        sql = "SELECT tag, COUNT(*) AS n FROM tags GROUP BY tag ORDER BY n DESC, tag LIMIT ?"
+        return conn.execute(sql, (limit,)).fetchall()
+
+    placeholders = ', '.join('?' * len(tags))
+    sql = f"""
+        SELECT t.tag, COUNT(*) AS n
+        FROM tags t
+        WHERE t.entry_id IN ({_intersection_subquery(tags)})
+          AND t.tag NOT IN ({placeholders})
+        GROUP BY t.tag
+        ORDER BY n DESC, t.tag
+        LIMIT ?
+    """
+    return conn.execute(sql, tags + tags + [limit]).fetchall()
+
+
+class TagBitmapCache:
+    """
+    Per-tag entry bitmaps for hot tags
+
+    Bit i is set when the entry with rowid i has the tag. The most recently
+    used `max_tags` bitmaps are kept; all of them are dropped as soon as the
+    database changes (PRAGMA data_version for other connections,
+    total_changes for this one).
+    """
+
+    def __init__(self, conn, max_tags=64):
+        self.conn = conn
+        self.max_tags = max_tags
+        self._bitmaps = OrderedDict()
+        self._version = None
+
+    def _check_version(self):
+        version = (self.conn.execute("PRAGMA data_version").fetchone()[0], self.conn.total_changes)
+        if version != self._version:
+            self._bitmaps.clear()
+            self._version = version
+
+    def _load(self, tag):
+        rowids = [r[0] for r in self.conn.execute("""
+            SELECT e.rowid FROM tags t
+            JOIN library_entries e ON e.entry_id = t.entry_id
+            WHERE t.tag = ?
+        """, (tag,))]
+        if not rowids:
+            return 0
+        buf = bytearray(max(rowids) // 8 + 1)
+        for rowid in rowids:
+            buf[rowid >> 3] |= 1 << (rowid & 7)
+        return int.from_bytes(buf, 'little')
+
+    def bitmap(self, tag):
+        """Bitmap of entries carrying `tag`"""
+        self._check_version()
+        bits = self._bitmaps.get(tag)
+        if bits is None:
+            bits = self._load(tag)
+            self._bitmaps[tag] = bits
+            if len(self._bitmaps) > self.max_tags:
+                self._bitmaps.popitem(last=False)
+        else:
+            self._bitmaps.move_to_end(tag)
+        return bits
+
+    def all_of(self, tags):
+        bits = None
+        for tag in tags:
+            bits = self.bitmap(tag) if bits is None else bits & self.bitmap(tag)
+            if not bits:
+                return 0
+        return bits or 0
+
+    def any_of(self, tags):
+        bits = 0
+        for tag in tags:
+            bits |= self.bitmap(tag)
+        return bits
+
+    @staticmethod
+    def count(bits):
+        return _popcount(bits)
+
+    @staticmethod
+    def rowids(bits):
+        """Set bit positions, ascending"""
+        data = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+        for i, byte in enumerate(data):
+            if byte:
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        yield (i << 3) | bit
+
+    def entries(self, bits, limit=None):
+        """Rows for a bitmap, newest first"""
+        sql = f"""
+            SELECT {ENTRY_COLUMNS}
+            FROM library_entries e
+            WHERE e.rowid IN (SELECT value FROM json_each(?))
+            ORDER BY e.created_at DESC
+        """
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return self.conn.execute(sql, (json.dumps(list(self.rowids(bits))),)).fetchall()
+
+    def facet_counts(self, tags, facet_tags):
+        """{facet tag: count} within the entries matching all of `tags`, most common first"""
+        base = self.all_of(tags) if tags else None
+        counts = {}
+        for tag in facet_tags:
+            bits = self.bitmap(tag)
+            counts[tag] = _popcount(bits if base is None else base & bits)
+        return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tag intersection, union and facet queries")
+    parser.add_argument('db', help="Library database")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--all', nargs='+', default=[], metavar='TAG', help="Entries with all tags")
+    group.add_argument('--any', nargs='+', default=[], metavar='TAG', help="Entries with any tag")
+    parser.add_argument('--facets', action='store_true', help="Tag counts (within the --all result set)")
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+
+    if args.all or args.any:
+        if args.all:
+            results = entries_with_all_tags(conn, args.all, args.limit)
+            label = ' AND '.join(args.all)
+        else:
+            results = entries_with_any_tag(conn, args.any, args.limit)
+            label = ' OR '.join(args.any)
+        print(f"\n🏷  Entries tagged {label}:")
+        for entry_id, entry_type, title in results:
+            print(f"  [{entry_type}] {entry_id}: {title}")
+
+    if args.facets or not (args.all or args.any):
+        print("\n📊 Tag facets:")
+        for tag, count in facet_counts(conn, args.all, args.limit):
+            print(f"  {tag}: {count}")
+    print()
+
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
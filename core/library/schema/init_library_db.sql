@@ -13,7 +13,10 @@ CREATE TABLE IF NOT EXISTS library_entries (
     updated_at TEXT NOT NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_entry_type ON library_entries(entry_type);
+-- (entry_type, created_at): type filter + newest-first without a sort step;
+-- replaces the single-column type index (its prefix)
+DROP INDEX IF EXISTS idx_entry_type;
+CREATE INDEX IF NOT EXISTS idx_entry_type_created ON library_entries(entry_type, created_at);
 CREATE INDEX IF NOT EXISTS idx_entry_created ON library_entries(created_at);
 CREATE INDEX IF NOT EXISTS idx_entry_confidence ON library_entries(confidence);
 
@@ -26,8 +29,11 @@ CREATE TABLE IF NOT EXISTS tags (
     UNIQUE(entry_id, tag)
 );
 
-CREATE INDEX IF NOT EXISTS idx_tags_entry ON tags(entry_id);
-CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag);
+-- Tags of an entry: served by UNIQUE(entry_id, tag)
+-- Entries with a tag: covering (tag, entry_id), no table lookup
+DROP INDEX IF EXISTS idx_tags_entry;
+DROP INDEX IF EXISTS idx_tags_tag;
+CREATE INDEX IF NOT EXISTS idx_tags_tag_entry ON tags(tag, entry_id);
 
 -- Entry Relationships
 CREATE TABLE IF NOT EXISTS entry_relationships (
@@ -41,8 +47,11 @@ CREATE TABLE IF NOT EXISTS entry_relationships (
     UNIQUE(from_entry_id, to_entry_id, relationship_type)
 );
 
-CREATE INDEX IF NOT EXISTS idx_rel_from ON entry_relationships(from_entry_id);
-CREATE INDEX IF NOT EXISTS idx_rel_to ON entry_relationships(to_entry_id);
+-- Outgoing links: served by UNIQUE(from_entry_id, to_entry_id, relationship_type)
+-- Backlinks: covering (to_entry_id, relationship_type, from_entry_id)
+DROP INDEX IF EXISTS idx_rel_from;
+DROP INDEX IF EXISTS idx_rel_to;
+CREATE INDEX IF NOT EXISTS idx_rel_to_type ON entry_relationships(to_entry_id, relationship_type, from_entry_id);
 CREATE INDEX IF NOT EXISTS idx_rel_type ON entry_relationships(relationship_type);
 
 -- Protocols Table (optional - for protocol references)
@@ -63,5 +72,112 @@ CREATE TABLE IF NOT EXISTS library_metadata (
     value TEXT NOT NULL
 );
 
-INSERT OR REPLACE INTO library_metadata (key, value) VALUES ('schema_version', '2.0.0');
+-- Change Log (change-data-capture for incremental sync)
+-- Filled by the triggers below; read with library_sync.sync_since(seq).
+-- row_key is the natural key as a JSON array (tags/relationship ids differ per machine),
+-- payload the full row as a JSON object (NULL for deletes).
+CREATE TABLE IF NOT EXISTS change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    op TEXT NOT NULL CHECK(op IN ('insert', 'update', 'delete')),
+    row_key TEXT NOT NULL,
+    payload TEXT,
+    changed_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+
+-- Latest change per row (library_sync.SYNC_COALESCED_SQL)
+CREATE INDEX IF NOT EXISTS idx_change_log_row ON change_log(table_name, row_key, seq);
+
+-- Triggers are skipped while library_sync applies a remote delta
+-- (library_metadata 'sync_applying'), so applied changes are not echoed back.
+
+CREATE TRIGGER IF NOT EXISTS trg_entries_insert AFTER INSERT ON library_entries
+WHEN NOT EXISTS (SELECT 1 FROM library_metadata WHERE key = 'sync_applying')
+BEGIN
+    INSERT INTO change_log (table_name, op, row_key, payload) VALUES (
+        'library_entries', 'insert', json_array(NEW.entry_id),
+        json_object('entry_id', NEW.entry_id, 'entry_type', NEW.entry_type, 'title', NEW.title,
+                    'content', NEW.content, 'metadata', NEW.metadata, 'confidence', NEW.confidence,
+                    'created_at', NEW.created_at, 'updated_at', NEW.updated_at));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_entries_update AFTER UPDATE ON library_entries
+WHEN NOT EXISTS (SELECT 1 FROM library_metadata WHERE key = 'sync_applying')
+BEGIN
+    INSERT INTO change_log (table_name, op, row_key, payload)
+    SELECT 'library_entries', 'delete', json_array(OLD.entry_id), NULL
+    WHERE OLD.entry_id <> NEW.entry_id;
+    INSERT INTO change_log (table_name, op, row_key, payload) VALUES (
+        'library_entries', 'update', json_array(NEW.entry_id),
+        json_object('entry_id', NEW.entry_id, 'entry_type', NEW.entry_type, 'title', NEW.title,
+                    'content', NEW.content, 'metadata', NEW.metadata, 'confidence', NEW.confidence,
+                    'created_at', NEW.created_at, 'updated_at', NEW.updated_at));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_entries_delete AFTER DELETE ON library_entries
+WHEN NOT EXISTS (SELECT 1 FROM library_metadata WHERE key = 'sync_applying')
+BEGIN
+    INSERT INTO change_log (table_name, op, row_key, payload)
+    VALUES ('library_entries', 'delete', json_array(OLD.entry_id), NULL);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tags_insert AFTER INSERT ON tags
+WHEN NOT EXISTS (SELECT 1 FROM library_metadata WHERE key = 'sync_applying')
+BEGIN
+    INSERT INTO change_log (table_name, op, row_key, payload) VALUES (
+        'tags', 'insert', json_array(NEW.entry_id, NEW.tag),
+        json_object('entry_id', NEW.entry_id, 'tag', NEW.tag));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tags_update AFTER UPDATE ON tags
+WHEN NOT EXISTS (SELECT 1 FROM library_metadata WHERE key = 'sync_applying')
+BEGIN
+    INSERT INTO change_log (table_name, op, row_key, payload)
+    VALUES ('tags', 'delete', json_array(OLD.entry_id, OLD.tag), NULL);
+    INSERT INTO change_log (table_name, op, row_key, payload) VALUES (
+        'tags', 'insert', json_array(NEW.entry_id, NEW.tag),
+        json_object('entry_id', NEW.entry_id, 'tag', NEW.tag));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tags_delete AFTER DELETE ON tags
+WHEN NOT EXISTS (SELECT 1 FROM library_metadata WHERE key = 'sync_applying')
+BEGIN
+    INSERT INTO change_log (table_name, op, row_key, payload)
+    VALUES ('tags', 'delete', json_array(OLD.entry_id, OLD.tag), NULL);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_rel_insert AFTER INSERT ON entry_relationships
+WHEN NOT EXISTS (SELECT 1 FROM library_metadata WHERE key = 'sync_applying')
+BEGIN
+    INSERT INTO change_log (table_name, op, row_key, payload) VALUES (
+        'entry_relationships', 'insert',
+        json_array(NEW.from_entry_id, NEW.to_entry_id, NEW.relationship_type),
+        json_object('from_entry_id', NEW.from_entry_id, 'to_entry_id', NEW.to_entry_id,
+                    'relationship_type', NEW.relationship_type, 'created_at', NEW.created_at));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_rel_update AFTER UPDATE ON entry_relationships
+WHEN NOT EXISTS (SELECT 1 FROM library_metadata WHERE key = 'sync_applying')
+BEGIN
+    INSERT INTO change_log (table_name, op, row_key, payload) VALUES (
+        'entry_relationships', 'delete',
+        json_array(OLD.from_entry_id, OLD.to_entry_id, OLD.relationship_type), NULL);
+    INSERT INTO change_log (table_name, op, row_key, payload) VALUES (
+        'entry_relationships', 'insert',
+        json_array(NEW.from_entry_id, NEW.to_entry_id, NEW.relationship_type),
+        json_object('from_entry_id', NEW.from_entry_id, 'to_entry_id', NEW.to_entry_id,
+                    'relationship_type', NEW.relationship_type, 'created_at', NEW.created_at));
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_rel_delete AFTER DELETE ON entry_relationships
+WHEN NOT EXISTS (SELECT 1 FROM library_metadata WHERE key = 'sync_applying')
+BEGIN
+    INSERT INTO change_log (table_name, op, row_key, payload) VALUES (
+        'entry_relationships', 'delete',
+        json_array(OLD.from_entry_id, OLD.to_entry_id, OLD.relationship_type), NULL);
+END;
+
+INSERT OR REPLACE INTO library_metadata (key, value) VALUES ('schema_version', '2.2.0');
 INSERT OR REPLACE INTO library_metadata (key, value) VALUES ('created_at', datetime('now'));
+-- Stable identity for sync peers (kept when the schema is re-applied)
+INSERT OR IGNORE INTO library_metadata (key, value) VALUES ('library_id', lower(hex(randomblob(16))));
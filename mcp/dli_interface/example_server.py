@@ -8,11 +8,50 @@ Replace the implementation with your own knowledge base and routing logic.
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
+import mcp.types as types
 import asyncio
+import json
+from pathlib import Path
+
+from tracing import Metrics, Tracer
 
 server = Server("dli-router")
 
-@server.call_tool()
+tracer = Tracer()
+
+# Tool definitions are kept in schema.json, the published interface
+SCHEMA_PATH = Path(__file__).parent / "schema.json"
+
+
+async def _retrieve(topic: str, mode: str) -> list:
+    """Fetch candidate context from your knowledge base (Library, docs, etc.)"""
+    # TODO: Replace with your knowledge base search
+    return ["source1.md", "source2.md"]
+
+
+async def _pattern_match(topic: str, sources: list) -> dict:
+    """Try to answer from the Pattern Engine before calling a model (FREE tier)"""
+    # TODO: Replace with your Pattern Engine
+    return {"matched": False, "answer": None}
+
+
+async def _model_tier(topic: str, sources: list) -> dict:
+    """Select the cheapest model tier that can answer and call it"""
+    # TODO: Replace with your model selection + LLM call
+    return {"tier": "cheap", "answer": f"Example answer for: {topic}", "cost": 0.001}
+
+
+def _format_response(answer: str, sources: list, cost: float, run_id: str) -> dict:
+    """Structure the answer consistently"""
+    return {
+        "answer": answer,
+        "sources": sources,
+        "cost": cost,
+        "run_id": run_id,
+        "note": "This is a reference implementation. Replace with your own logic."
+    }
+
+
 async def dli_deep_dive(topic: str, mode: str = "pattern") -> dict:
     """
     Run a DLI deep dive.
@@ -23,6 +62,9 @@ async def dli_deep_dive(topic: str, mode: str = "pattern") -> dict:
     3. Model selection strategy
     4. Response formatting
     
+    Each stage runs inside a tracing span, so the trace log and
+    dli_metrics show which stage (slow tier, slow Library query) costs time.
+    
     Args:
         topic: Question to research
         mode: "baseline" | "pattern" | "both"
@@ -35,19 +77,85 @@ async def dli_deep_dive(topic: str, mode: str = "pattern") -> dict:
             "run_id": str
         }
     """
+    with tracer.run("dli_deep_dive", mode=mode, topic_chars=len(topic)) as run:
+        with run.span("retrieval") as span:
+            sources = await _retrieve(topic, mode)
+            span["results"] = len(sources)
+        
+        match = {"matched": False, "answer": None}
+        if mode in ("pattern", "both"):
+            with run.span("pattern_match") as span:
+                match = await _pattern_match(topic, sources)
+                span["matched"] = match["matched"]
+            tracer.metrics.incr("pattern_match.hits" if match["matched"] else "pattern_match.misses")
+        
+        if match["matched"]:
+            answer, cost = match["answer"], 0.0
+        else:
+            with run.span("model_tier") as span:
+                result = await _model_tier(topic, sources)
+                span["tier"] = result["tier"]
+                span["cost"] = result["cost"]
+            tracer.metrics.incr(f"model_tier.{result['tier']}")
+            answer, cost = result["answer"], result["cost"]
+        
+        with run.span("formatting"):
+            response = _format_response(answer, sources, cost, run.run_id)
+        
+        run.attributes["cost"] = cost
+        return response
+
+
+async def dli_metrics(reset: bool = False) -> dict:
+    """
+    Report counters and latency histograms for this server process.
     
-    # TODO: Replace with your implementation
-    # Example:
-    # results = await your_knowledge_base.search(topic)
-    # answer = await your_llm.generate(topic, context=results)
+    Args:
+        reset: Clear metrics after reading them
     
-    return {
-        "answer": f"Example answer for: {topic}",
-        "sources": ["source1.md", "source2.md"],
-        "cost": 0.001,
-        "run_id": "example-run-123",
-        "note": "This is a reference implementation. Replace with your own logic."
-    }
+    Returns:
+        {
+            "started_at": str,
+            "counters": dict,
+            "histograms": dict,
+            "trace_log": str
+        }
+    """
+    snapshot = tracer.metrics.snapshot()
+    snapshot["trace_log"] = str(tracer.trace_log.path)
+    if reset:
+        tracer.metrics = Metrics()
+    return snapshot
+
+
+TOOLS = {
+    "dli_deep_dive": dli_deep_dive,
+    "dli_metrics": dli_metrics,
+}
+
+
+@server.list_tools()
+async def list_tools() -> list:
+    """Advertise the tools defined in schema.json"""
+    with open(SCHEMA_PATH, 'r') as f:
+        schema = json.load(f)
+    return [
+        types.Tool(name=tool["name"], description=tool["description"], inputSchema=tool["inputSchema"])
+        for tool in schema["tools"]
+    ]
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict) -> list:
+    """
+    Single MCP tool handler - the low-level Server keeps one call_tool
+    handler, so every tool is dispatched from here by name.
+    """
+    handler = TOOLS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+    result = await handler(**(arguments or {}))
+    return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
 
 async def main():
     async with stdio_server() as (read_stream, write_stream):
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+DLI Tracing and Metrics
+
+Per-run tracing for the DLI server:
+- Spans for each stage of a deep dive (retrieval, pattern match, model tier, formatting)
+- Counters and latency histograms aggregated across runs
+- Rotating JSONL trace log (one line per run)
+
+Standard library only, so it can be dropped into any DLI implementation.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +inf)
+DEFAULT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+DEFAULT_TRACE_LOG = Path(__file__).parent / "logs" / "dli_traces.jsonl"
+
+
+class Histogram:
+    """Fixed-bucket latency histogram"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value: float):
+        """Record one observation"""
+        idx = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                idx = i
+                break
+        self.counts[idx] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate quantile (bucket upper bound containing it)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summary suitable for JSON output"""
+        labels = [f"le_{b}" for b in self.buckets] + ["le_inf"]
+        return {
+            'count': self.count,
+            'sum_ms': round(self.total, 3),
+            'avg_ms': round(self.total / self.count, 3) if self.count else None,
+            'min_ms': round(self.min, 3) if self.min is not None else None,
+            'max_ms': round(self.max, 3) if self.max is not None else None,
+            'p50_ms': self.quantile(0.5),
+            'p95_ms': self.quantile(0.95),
+            'buckets': dict(zip(labels, self.counts))
+        }
+
+
+class Metrics:
+    """Thread-safe counters and histograms"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self.started_at = datetime.now().isoformat()
+
+    def incr(self, name: str, value: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, value_ms: float):
+        with self._lock:
+            hist = self.histograms.get(name)
+            if hist is None:
+                hist = self.histograms[name] = Histogram()
+            hist.observe(value_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'started_at': self.started_at,
+                'counters': dict(self.counters),
+                'histograms': {name: h.snapshot() for name, h in self.histograms.items()}
+            }
+
+
+class TraceLog:
+    """Append-only JSONL trace log with size-based rotation"""
+
+    def __init__(self, path=None, max_bytes: int = 5 * 1024 * 1024, backup_count: int = 3):
+        self.path = Path(path or os.environ.get('DLI_TRACE_LOG', DEFAULT_TRACE_LOG))
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, Any]):
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            # Directory is created on first write, not at import
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists() and self.path.stat().st_size + len(line) > self.max_bytes:
+                self._rotate()
+            with open(self.path, 'a') as f:
+                f.write(line)
+
+    def _rotate(self):
+        """Shift dli_traces.jsonl -> .1 -> .2 ... dropping the oldest"""
+        for i in range(self.backup_count - 1, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{i}")
+            if src.exists():
+                src.replace(self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backup_count > 0:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+
+class RunTrace:
+    """Trace for a single DLI run"""
+
+    def __init__(self, tracer: 'Tracer', tool: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.tool = tool
+        self.run_id = f"run-{uuid.uuid4().hex[:12]}"
+        self.attributes = dict(attributes)
+        self.spans: List[Dict[str, Any]] = []
+        self.started_at = datetime.now().isoformat()
+        self._start = time.perf_counter()
+        self.status = 'ok'
+        self.error = None
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Time a stage; extra attributes can be set on the yielded dict"""
+        record = {'name': name, 'attributes': dict(attributes)}
+        start = time.perf_counter()
+        try:
+            yield record['attributes']
+        except Exception as e:
+            record['error'] = repr(e)
+            self.tracer.metrics.incr(f"span.{name}.errors")
+            raise
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            record['offset_ms'] = round((start - self._start) * 1000, 3)
+            record['duration_ms'] = round(duration_ms, 3)
+            self.spans.append(record)
+            self.tracer.metrics.observe(f"span.{name}.ms", duration_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'run_id': self.run_id,
+            'tool': self.tool,
+            'started_at': self.started_at,
+            'duration_ms': round((time.perf_counter() - self._start) * 1000, 3),
+            'status': self.status,
+            'error': self.error,
+            'attributes': self.attributes,
+            'spans': self.spans
+        }
+
+
+class Tracer:
+    """Creates run traces and feeds metrics + trace log"""
+
+    def __init__(self, trace_log: Optional[TraceLog] = None, metrics: Optional[Metrics] = None):
+        self.trace_log = trace_log or TraceLog()
+        self.metrics = metrics or Metrics()
+
+    @contextmanager
+    def run(self, tool: str, **attributes):
+        """Trace one tool call; yields the RunTrace"""
+        trace = RunTrace(self, tool, attributes)
+        self.metrics.incr(f"{tool}.calls")
+        try:
+            yield trace
+        except Exception as e:
+            trace.status = 'error'
+            trace.error = repr(e)
+            self.metrics.incr(f"{tool}.errors")
+            raise
+        finally:
+            record = trace.to_dict()
+            self.metrics.observe(f"{tool}.ms", record['duration_ms'])
+            try:
+                self.trace_log.write(record)
+            except OSError as e:
+                # Never fail a request because the trace log is unwritable.
+                # stdout is the MCP transport, so warnings go to stderr.
+                self.metrics.incr("trace_log.write_errors")
+                print(f"Warning: Could not write trace log: {e}", file=sys.stderr)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Email Ingestion Stage
+
+RFC822 messages → transcript → MinimalMeetingProcessor.
+
+- Parses messages from a local maildir or mbox with the `email` package
+- Finds the transcript in one scan: a text/plain attachment (Otter .txt
+  export) wins, otherwise the plain body after the first transcript marker
+- LocalChannelSource stands in for the `otter_api` / `gmail` channels in
+  meeting_automation/config.json, so the full pipeline can be load-tested
+  offline against generated fixture mail
+
+Usage:
+    python email_ingest.py --maildir ~/Mail/otter
+    python email_ingest.py --mbox otter_export.mbox
+    python email_ingest.py --config config.json --local-root fixtures/ --generate 500
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import time
+from datetime import datetime, timedelta
+from email import policy
+from email.message import EmailMessage
+from email.parser import BytesParser
+from email.utils import format_datetime, parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from minimal_meeting_processor import MinimalMeetingProcessor
+from note_importer import iter_mbox_messages
+
+
+_QUERY_TERM = re.compile(r'(\w+):(\S+)')
+
+
+# ---------------------------------------------------------------------------
+# Transcript extraction
+# ---------------------------------------------------------------------------
+
+def find_transcript(msg, processor: MinimalMeetingProcessor) -> Optional[str]:
+    """
+    Locate the transcript in one walk over the MIME tree
+
+    Preference: text/plain attachment > first text/plain body part (after
+    transcript marker) > first text/html part (tags stripped).
+    """
+    body_text = None
+    html_text = None
+
+    for part in msg.walk():
+        if part.is_multipart():
+            continue
+        content_type = part.get_content_type()
+        if content_type not in ('text/plain', 'text/html'):
+            continue
+
+        try:
+            text = part.get_content()
+        except (LookupError, UnicodeDecodeError):
+            text = (part.get_payload(decode=True) or b'').decode('utf-8', errors='replace')
+
+        if content_type == 'text/plain' and part.get_content_disposition() == 'attachment':
+            # Otter transcript export - use as-is
+            return text.strip()
+        if content_type == 'text/plain' and body_text is None:
+            body_text = text
+        elif content_type == 'text/html' and html_text is None:
+            html_text = re.sub(r'<[^>]+>', ' ', text)
+
+    text = body_text if body_text is not None else html_text
+    if text is None:
+        return None
+    return processor._extract_transcript_from_email(text)
+
+
+def message_email_data(msg) -> Dict:
+    """Subject and YYYY-MM-DD date for process_otter_transcript"""
+    data = {'subject': str(msg.get('subject', '') or 'Unknown Meeting')}
+    try:
+        if msg['date']:
+            data['date'] = parsedate_to_datetime(msg['date']).strftime('%Y-%m-%d')
+    except (TypeError, ValueError):
+        pass
+    return data
+
+
+def process_message(processor: MinimalMeetingProcessor, msg) -> Optional[Dict]:
+    """Run one RFC822 message through the minimal processor"""
+    transcript = find_transcript(msg, processor)
+    if not transcript:
+        return None
+    return processor.process_otter_transcript(transcript, message_email_data(msg))
+
+
+# ---------------------------------------------------------------------------
+# Local sources
+# ---------------------------------------------------------------------------
+
+_PARSER = BytesParser(policy=policy.default)
+
+
+def iter_maildir(path, unread_only: bool = True, mark_as_read: bool = False,
+                 predicate: Optional[Callable[[EmailMessage], bool]] = None) -> Iterator[EmailMessage]:
+    """
+    Yield messages from a maildir
+
+    Unread mail lives in new/; marking as read moves it to cur/ with the
+    Seen flag, the same as a mail client would. With a predicate, only
+    matching messages are yielded - and only those are marked as read.
+    """
+    path = Path(path)
+    subdirs = ['new'] if unread_only else ['new', 'cur']
+
+    for subdir in subdirs:
+        folder = path / subdir
+        if not folder.is_dir():
+            continue
+        for entry in sorted(os.scandir(folder), key=lambda e: e.name):
+            if not entry.is_file():
+                continue
+            with open(entry.path, 'rb') as f:
+                msg = _PARSER.parse(f)
+            if predicate is not None and not predicate(msg):
+                continue
+            yield msg
+
+            if mark_as_read and subdir == 'new':
+                os.replace(entry.path, path / 'cur' / f"{entry.name}:2,S")
+
+
+def parse_query(query: str) -> Dict[str, str]:
+    """Gmail-style 'from:x subject:y is:unread' → {'from': 'x', ...}"""
+    return {key.lower(): value for key, value in _QUERY_TERM.findall(query or '')}
+
+
+def matches_query(msg, terms: Dict[str, str]) -> bool:
+    """Apply the from:/subject: terms of a Gmail query"""
+    if 'from' in terms and terms['from'].lower() not in str(msg.get('from', '')).lower():
+        return False
+    if 'subject' in terms and terms['subject'].lower() not in str(msg.get('subject', '')).lower():
+        return False
+    return True
+
+
+class LocalChannelSource:
+    """
+    Offline stand-in for an `otter_api` or `gmail` channel
+
+    Each channel is a maildir under local_root/<channel>/. fetch() returns
+    unread messages matching the channel's search query and (like the
+    real channels with processing.mark_as_read) marks them read.
+    """
+
+    def __init__(self, channel: str, local_root, channel_config: Optional[Dict] = None,
+                 mark_as_read: bool = True):
+        self.channel = channel
+        self.path = Path(local_root) / channel
+        self.config = channel_config or {}
+        self.terms = parse_query(self.config.get('search_query', ''))
+        self.mark_as_read = mark_as_read
+
+    def fetch(self) -> Iterator[EmailMessage]:
+        return iter_maildir(self.path, unread_only=True, mark_as_read=self.mark_as_read,
+                            predicate=lambda msg: matches_query(msg, self.terms))
+
+
+def sources_from_config(config: Dict, local_root) -> List[LocalChannelSource]:
+    """Stand-in sources for the enabled channels, primary first"""
+    strategy = config.get('strategy', {})
+    mark_as_read = config.get('processing', {}).get('mark_as_read', True)
+
+    channels = []
+    for channel in (strategy.get('primary'), strategy.get('fallback')):
+        if channel and channel not in channels and config.get(channel, {}).get('enabled', True):
+            channels.append(channel)
+
+    return [LocalChannelSource(c, local_root, config.get(c), mark_as_read) for c in channels]
+
+
+# ---------------------------------------------------------------------------
+# Fixtures for offline load tests
+# ---------------------------------------------------------------------------
+
+_FIXTURE_SPEAKERS = ['Alex Smith', 'Sam Lee', 'Jordan Park', 'Casey Brown', 'Riley Chen']
+_FIXTURE_LINES = [
+    'Quick update on the rollout schedule.',
+    'Hardware was delivered on Tuesday.',
+    'We still need to confirm the installer window.',
+    'Support for the second location is pending.',
+    'Let us review the numbers next week.',
+]
+
+
+def fixture_message(channel: str, index: int, when: datetime, sender: str, subject: str,
+                    rng: random.Random) -> EmailMessage:
+    """Synthetic Otter email; otter_api delivers an attachment, gmail an inline body"""
+    lines = []
+    for minute in range(rng.randint(10, 60)):
+        speaker = rng.choice(_FIXTURE_SPEAKERS)
+        lines.append(f"{speaker}  {minute}:{rng.randint(0, 59):02d}")
+        lines.append(' '.join(rng.choice(_FIXTURE_LINES) for _ in range(rng.randint(3, 12))))
+        lines.append('')
+    transcript = "\n".join(lines)
+
+    msg = EmailMessage()
+    msg['From'] = sender
+    msg['Subject'] = f"{subject} {index:05d}"
+    msg['Date'] = format_datetime(when)
+    if channel == 'otter_api':
+        msg.set_content("Your transcript is attached.")
+        msg.add_attachment(transcript, subtype='plain', filename=f"meeting_{index:05d}.txt")
+    else:
+        msg.set_content(f"Meeting summary below.\n\nTranscript:\n{transcript}")
+    return msg
+
+
+def write_fixture_maildir(source: LocalChannelSource, count: int, seed: int = 8825) -> int:
+    """Write count unread fixture messages into a channel's maildir"""
+    rng = random.Random(seed)
+    for subdir in ('tmp', 'new', 'cur'):
+        (source.path / subdir).mkdir(parents=True, exist_ok=True)
+
+    sender = source.terms.get('from', 'Otter.ai')
+    subject = source.terms.get('subject', 'Meeting')
+    start = datetime(2025, 1, 1, 9, 0).astimezone()
+
+    for i in range(count):
+        when = start + timedelta(days=i // 4, hours=2 * (i % 4))
+        msg = fixture_message(source.channel, i, when, sender, subject, rng)
+        name = f"{int(when.timestamp())}.{i:06d}.{source.channel}"
+        # Maildir delivery: write to tmp/, then rename into new/
+        tmp_path = source.path / 'tmp' / name
+        with open(tmp_path, 'wb') as f:
+            f.write(msg.as_bytes())
+        os.replace(tmp_path, source.path / 'new' / name)
+
+    return count
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def run(messages, processor: MinimalMeetingProcessor, label: str) -> int:
+    """Process messages and report throughput"""
+    start = time.perf_counter()
+    processed = skipped = 0
+
+    for msg in messages:
+        if process_message(processor, msg):
+            processed += 1
+        else:
+            skipped += 1
+
+    elapsed = time.perf_counter() - start
+    rate = processed / elapsed if elapsed > 0 else 0
+    print(f"   {label}: {processed} processed, {skipped} without transcript "
+          f"({elapsed:.2f}s, {rate:.0f} msg/s)")
+    return processed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Ingest Otter emails from local maildir/mbox into the minimal processor"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--maildir', help="Maildir to read (unread messages in new/)")
+    source.add_argument('--mbox', help="mbox file to read")
+    source.add_argument('--config', help="meeting_automation config.json (use local channel stand-ins)")
+    parser.add_argument('--local-root', default='local_mail',
+                        help="Root of stand-in channel maildirs (with --config)")
+    parser.add_argument('--generate', type=int, default=0,
+                        help="Write N fixture messages per channel first (with --config)")
+    parser.add_argument('--output-dir', '-o', help="Processor output dir (default: HCSS meetings folder)")
+    parser.add_argument('--tasks', action='store_true',
+                        help="Upsert extracted action items into the task tracker")
+    args = parser.parse_args()
+
+    task_store = None
+    if args.tasks:
+        from task_tracker import TaskStore
+        task_store = TaskStore()
+
+    processor = MinimalMeetingProcessor(output_dir=args.output_dir, task_store=task_store)
+    print(f"\n📥 Ingesting into {processor.output_dir}\n")
+
+    if args.maildir:
+        total = run(iter_maildir(args.maildir), processor, args.maildir)
+    elif args.mbox:
+        total = run(iter_mbox_messages(args.mbox), processor, args.mbox)
+    else:
+        with open(args.config, 'r') as f:
+            config = json.load(f)
+
+        total = 0
+        for channel_source in sources_from_config(config, args.local_root):
+            if args.generate:
+                write_fixture_maildir(channel_source, args.generate)
+            total += run(channel_source.fetch(), processor, channel_source.channel)
+
+    print(f"\n✅ Processed {total} meetings\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ Extracts ONLY what's needed for timesheets:
 - Duration
 - Attendees
 - Meeting title
+- Action items (rule-based, same pass as attendees)
 
 Preserves full transcript for Cascade to read when needed.
 
@@ -16,26 +17,177 @@ NO heavy summarization. NO OpenAI calls. Just metadata + raw transcript.
 import os
 import json
 import re
-from datetime import datetime
+import sys
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+# Opt-in stage timing (PERF_STAGES=1) from shared/perf; no-op stages outside the repo
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "perf"))
+    from perf_stages import stage
+except (IndexError, ImportError):
+    _NULL_STAGE = type('NullStage', (), {'__enter__': lambda self: self, '__exit__': lambda self, *exc: None,
+                                         '__call__': lambda self, func: func})()
+    stage = lambda name: _NULL_STAGE  # noqa: E731  (with stage(...) / @stage(...))
+
+
+DEFAULT_MEETINGS_DIR = Path.home() / "Hammer Consulting Dropbox/Justin Harmon/Public/8825/8825_files/HCSS/meetings"
+DEFAULT_PROJECT = 'HCSS/TGIF'
+
+# Otter emails put the transcript after one of these markers (earlier = preferred)
+TRANSCRIPT_MARKERS = ('Transcript:', 'Conversation:', '---')
+_TRANSCRIPT_MARKER_RE = re.compile('|'.join(re.escape(m) for m in TRANSCRIPT_MARKERS))
+
+# Otter format: "Name  timestamp\ntext"
+_SPEAKER_RE = re.compile(r'^([A-Z][a-z]+(?: [A-Z][a-z]+)*)\s+\d+:\d+\s*$')
+
+# Action items - cheap prefilter first, so most lines cost one search
+_ACTION_HINT_RE = re.compile(
+    r"action item|to-?do|follow[- ]?up|next step|\bwill\b|['\u2019]ll\b|\bneeds? to\b|going to",
+    re.IGNORECASE
+)
+_EXPLICIT_ACTION_RE = re.compile(
+    r'(?:^|[.!?]\s+)(?:[-*\u2022]\s*)?(?:action items?|to-?dos?|follow[- ]?ups?|next steps?)\s*[:\-\u2013]\s*(?P<what>.+)$',
+    re.IGNORECASE
+)
+_ASSIGNEE_RE = re.compile(r"^@?(?P<who>[A-Z][a-z]+)(?:\s+(?:to|will)|['\u2019]ll|:)\s+(?P<what>.+)$")
+_COMMITMENT_WHO = r"(?:I|we|you|they|he|she|someone|everyone|@?[A-Z][a-z]+)"
+_COMMITMENT_VERB = r"(?:will|['\u2019]ll|need to|needs to|am going to|is going to|are going to)"
+# `what` stops at the sentence end or at the next "and/so <who> will ..." clause
+_COMMITMENT_RE = re.compile(
+    rf"(?:^|[.!?;]\s+|\band\s+|\bso\s+)(?P<who>{_COMMITMENT_WHO})\s*{_COMMITMENT_VERB}\s+"
+    rf"(?P<what>[^.!?;]+?)(?=,?\s+(?:and|so)\s+{_COMMITMENT_WHO}\s*{_COMMITMENT_VERB}\s|\s*(?:[.!?;]|$))"
+)
+_DUE_RE = re.compile(
+    r'\b(\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}(?:/\d{2,4})?|(?:mon|tues|wednes|thurs|fri|satur|sun)day'
+    r'|tomorrow|today|eod|eow|end of (?:the )?(?:day|week)|next week)\b',
+    re.IGNORECASE
+)
+_HIGH_PRIORITY_RE = re.compile(r'\b(?:urgent|asap|critical|blocker|immediately|top priority)\b', re.IGNORECASE)
+_LOW_PRIORITY_RE = re.compile(r'\b(?:low priority|eventually|nice to have|when (?:you|we) get a chance)\b',
+                              re.IGNORECASE)
+_NON_PERSON = {'It', 'This', 'That', 'There', 'Which', 'What', 'Then', 'Now', 'So', 'And'}
+# Pronouns and quantifiers: a commitment, but no single owner (who=None)
+_UNASSIGNED = {'We', 'You', 'They', 'He', 'She', 'Someone', 'Somebody', 'Everyone', 'Everybody',
+               'Anyone', 'Anybody', 'Nobody', 'All', 'Both', 'Each', 'Everything', 'Team'}
+_WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+
+def parse_due(phrase: str, meeting_date: str) -> Optional[str]:
+    """Resolve a due phrase ("Friday", "11/20", "tomorrow") against the meeting date"""
+    try:
+        base = date.fromisoformat(meeting_date)
+    except (TypeError, ValueError):
+        base = date.today()
+    p = phrase.lower()
+    
+    try:
+        if '-' in p:
+            return date.fromisoformat(p).isoformat()
+        if '/' in p:
+            parts = [int(x) for x in p.split('/')]
+            year = base.year if len(parts) == 2 else (parts[2] + 2000 if parts[2] < 100 else parts[2])
+            due = date(year, parts[0], parts[1])
+            if len(parts) == 2 and due < base:
+                due = date(year + 1, parts[0], parts[1])
+            return due.isoformat()
+    except ValueError:
+        return None
+    
+    if p in ('today', 'eod') or p.startswith('end of') and p.endswith('day'):
+        return base.isoformat()
+    if p == 'tomorrow':
+        return (base + timedelta(days=1)).isoformat()
+    if p == 'next week':
+        return (base + timedelta(days=7)).isoformat()
+    if p == 'eow' or p.endswith('week'):
+        p = 'friday'
+    if p in _WEEKDAYS:
+        days_ahead = (_WEEKDAYS.index(p) - base.weekday()) % 7 or 7
+        return (base + timedelta(days=days_ahead)).isoformat()
+    return None
+
+
+def _action_item(what: str, who: Optional[str], line: str, meeting_date: str) -> Optional[Dict]:
+    what = what.strip().rstrip('.,;:')
+    if len(what) < 3:
+        return None
+    
+    due_match = _DUE_RE.search(line)
+    if _HIGH_PRIORITY_RE.search(line):
+        priority = 'high'
+    elif _LOW_PRIORITY_RE.search(line):
+        priority = 'low'
+    else:
+        priority = 'medium'
+    
+    return {
+        'what': what[:200],
+        'who': who,
+        'due': parse_due(due_match.group(1), meeting_date) if due_match else None,
+        'priority': priority,
+        'source': 'meeting'
+    }
+
+
+def extract_action_items(line: str, speaker: Optional[str], meeting_date: str) -> List[Dict]:
+    """
+    Rule-based action items from one transcript line
+    
+    - Explicit: "Action item: Sam to send the deck", "Next steps - ..."
+    - Commitments with a due cue: "I'll send the deck by Friday"
+      ("I" is the current speaker, "we"/"they"/"someone" leave it unassigned;
+      commitments without a date are ignored)
+    """
+    explicit = _EXPLICIT_ACTION_RE.search(line)
+    if explicit:
+        what, who = explicit.group('what'), None
+        assignee = _ASSIGNEE_RE.match(what)
+        if assignee and assignee.group('who') not in _NON_PERSON:
+            what = assignee.group('what')
+            if assignee.group('who') not in _UNASSIGNED:
+                who = assignee.group('who')
+        item = _action_item(what, who, line, meeting_date)
+        return [item] if item else []
+    
+    items = []
+    for match in _COMMITMENT_RE.finditer(line):
+        who = match.group('who').lstrip('@')
+        if who in _NON_PERSON or not _DUE_RE.search(match.group('what')):
+            continue
+        if who == 'I':
+            who = speaker
+        elif who.capitalize() in _UNASSIGNED:
+            who = None
+        item = _action_item(match.group('what'), who, match.group('what'), meeting_date)
+        if item:
+            items.append(item)
+    return items
 
 
 class MinimalMeetingProcessor:
     """Extract minimal metadata from meeting transcripts"""
     
-    def __init__(self, output_dir=None):
+    def __init__(self, output_dir=None, task_store=None):
         if output_dir is None:
-            base = Path.home() / "Hammer Consulting Dropbox/Justin Harmon/Public/8825"
-            output_dir = base / "8825_files/HCSS/meetings"
+            output_dir = DEFAULT_MEETINGS_DIR
         
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Optional TaskStore: action items are bulk-upserted after each meeting
+        self.task_store = task_store
         
-        # Create subdirectories
-        (self.output_dir / "transcripts").mkdir(exist_ok=True)
-        (self.output_dir / "metadata").mkdir(exist_ok=True)
+        # Directories are created on first write, not on startup
+        self.output_dir = Path(output_dir)
+        self._dirs_ready = False
     
+    def _ensure_dirs(self):
+        """Create output and subdirectories once, before the first write"""
+        if not self._dirs_ready:
+            (self.output_dir / "transcripts").mkdir(parents=True, exist_ok=True)
+            (self.output_dir / "metadata").mkdir(parents=True, exist_ok=True)
+            self._dirs_ready = True
+    
+    @stage('processor.process_otter_transcript')
     def process_otter_transcript(self, transcript_text: str, email_data: Dict = None) -> Dict:
         """
         Process Otter transcript - extract minimal metadata only
@@ -55,25 +207,35 @@ class MinimalMeetingProcessor:
         safe_title = self._sanitize_filename(metadata['title'])
         base_filename = f"{date_str}_{safe_title}"
         
-        # Save full transcript
-        transcript_path = self.output_dir / "transcripts" / f"{base_filename}.txt"
-        with open(transcript_path, 'w') as f:
-            f.write(transcript_text)
-        
-        # Save metadata JSON
-        metadata_path = self.output_dir / "metadata" / f"{base_filename}.json"
-        metadata['transcript_path'] = str(transcript_path)
-        metadata['processed_at'] = datetime.now().isoformat()
+        with stage('processor.save'):
+            # Save full transcript
+            self._ensure_dirs()
+            transcript_path = self.output_dir / "transcripts" / f"{base_filename}.txt"
+            with open(transcript_path, 'w') as f:
+                f.write(transcript_text)
+            
+            # Save metadata JSON
+            metadata_path = self.output_dir / "metadata" / f"{base_filename}.json"
+            metadata['transcript_path'] = str(transcript_path)
+            metadata['processed_at'] = datetime.now().isoformat()
+            
+            with open(metadata_path, 'w') as f:
+                json.dump(metadata, f, indent=2)
         
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
-        
-        return {
+        result = {
             'metadata': metadata,
             'transcript_path': str(transcript_path),
             'metadata_path': str(metadata_path)
         }
+        
+        if self.task_store is not None and metadata['action_items']:
+            with stage('processor.task_upsert'):
+                upserted = self.task_store.upsert_many(metadata['action_items'], id_date=metadata['date'])
+            result['tasks'] = {k: [t['id'] for t in v] for k, v in upserted.items()}
+        
+        return result
     
+    @stage('processor.extract_metadata')
     def _extract_metadata(self, transcript: str, email_data: Dict = None) -> Dict:
         """Extract minimal metadata from transcript"""
         
@@ -83,6 +245,7 @@ class MinimalMeetingProcessor:
             'time': None,
             'duration_minutes': None,
             'attendees': [],
+            'action_items': [],
             'source': 'otter'
         }
         
@@ -92,18 +255,35 @@ class MinimalMeetingProcessor:
             if 'date' in email_data:
                 metadata['date'] = email_data['date']
         
-        # Extract attendees from transcript
-        # Otter format: "Name  timestamp\ntext"
-        attendee_pattern = r'^([A-Z][a-z]+(?: [A-Z][a-z]+)*)\s+\d+:\d+\s*$'
+        # Single scan: speaker lines give attendees, other lines are
+        # checked for action items (attributed to the current speaker)
         attendees = set()
+        action_items = []
+        speaker = None
         
         for line in transcript.split('\n'):
-            match = re.match(attendee_pattern, line.strip())
+            line = line.strip()
+            if not line:
+                continue
+            match = _SPEAKER_RE.match(line)
             if match:
-                attendees.add(match.group(1))
+                speaker = match.group(1)
+                attendees.add(speaker)
+            elif _ACTION_HINT_RE.search(line):
+                action_items.extend(extract_action_items(line, speaker, metadata['date']))
         
         metadata['attendees'] = sorted(list(attendees))
         
+        # "Sam" -> "Sam Lee" when exactly one attendee has that first name
+        first_names = {}
+        for name in attendees:
+            first_names.setdefault(name.split()[0], []).append(name)
+        for item in action_items:
+            full = first_names.get(item['who'] or '')
+            if full and len(full) == 1:
+                item['who'] = full[0]
+        metadata['action_items'] = action_items
+        
         # Try to extract duration from transcript length (rough estimate)
         # Assume ~150 words per minute of speaking
         word_count = len(transcript.split())
@@ -138,14 +318,18 @@ class MinimalMeetingProcessor:
         # This is a simple extraction - adjust based on actual email format
         # Usually transcript is after "Transcript:" or similar
         
-        # Try to find transcript section
-        markers = ['Transcript:', 'Conversation:', '---']
+        # Find the preferred marker in a single scan of the body
+        # (first occurrence of the highest-priority marker present)
+        best = None
+        for match in _TRANSCRIPT_MARKER_RE.finditer(email_body):
+            priority = TRANSCRIPT_MARKERS.index(match.group())
+            if best is None or priority < best[0]:
+                best = (priority, match.end())
+                if priority == 0:
+                    break
         
-        for marker in markers:
-            if marker in email_body:
-                parts = email_body.split(marker, 1)
-                if len(parts) > 1:
-                    return parts[1].strip()
+        if best is not None:
+            return email_body[best[1]:].strip()
         
         # If no marker found, return whole body
         return email_body
@@ -156,15 +340,20 @@ class MinimalMeetingProcessor:
         with open(metadata_path, 'r') as f:
             metadata = json.load(f)
         
-        return {
-            'date': metadata['date'],
-            'duration_minutes': metadata['duration_minutes'],
-            'duration_hours': round(metadata['duration_minutes'] / 60, 2),
-            'title': metadata['title'],
-            'attendees': metadata['attendees'],
-            'project': 'HCSS/TGIF',  # Could be extracted from title
-            'billable': True
-        }
+        return timesheet_entry(metadata)
+
+
+def timesheet_entry(metadata: Dict) -> Dict:
+    """Build timesheet entry from an in-memory metadata dict"""
+    return {
+        'date': metadata['date'],
+        'duration_minutes': metadata['duration_minutes'],
+        'duration_hours': round(metadata['duration_minutes'] / 60, 2),
+        'title': metadata['title'],
+        'attendees': metadata['attendees'],
+        'project': metadata.get('client') or DEFAULT_PROJECT,
+        'billable': True
+    }
 
 
 def main():
@@ -172,7 +361,8 @@ def main():
     import sys
     
     if len(sys.argv) < 2:
-        print("Usage: python minimal_meeting_processor.py <transcript_file>")
+        print("Usage: python minimal_meeting_processor.py <transcript_file> [--tasks]")
+        print("  --tasks  Upsert extracted action items into the task tracker")
         sys.exit(1)
     
     transcript_file = sys.argv[1]
@@ -180,7 +370,12 @@ def main():
     with open(transcript_file, 'r') as f:
         transcript = f.read()
     
-    processor = MinimalMeetingProcessor()
+    task_store = None
+    if '--tasks' in sys.argv[2:]:
+        from task_tracker import TaskStore
+        task_store = TaskStore()
+    
+    processor = MinimalMeetingProcessor(task_store=task_store)
     result = processor.process_otter_transcript(transcript)
     
     print("\n✅ Processed meeting:")
@@ -189,6 +384,11 @@ def main():
     print("\nMetadata:")
     print(json.dumps(result['metadata'], indent=2))
     
+    if 'tasks' in result:
+        print("\nTask tracker:")
+        for status, ids in result['tasks'].items():
+            print(f"   {status}: {len(ids)}")
+    
     print("\nTimesheet entry:")
     timesheet = processor.generate_timesheet_entry(result['metadata_path'])
     print(json.dumps(timesheet, indent=2))
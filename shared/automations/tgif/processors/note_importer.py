@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Bulk Note Importer
+
+Migrate history into post-meeting notes in one process:
+- mbox files are streamed and parsed one message at a time
+- Slack exports (directory of channel/YYYY-MM-DD.json, or one channel JSON file)
+  are read one day file at a time
+
+Messages are routed to notes by (date, topic): every message on the same
+day with the same subject/channel becomes one note. Notes are written as
+soon as their day is over (or --batch-size notes are pending), through
+PostMeetingCapture.capture_many, so each batch is one pass per renderer.
+
+Usage:
+    python note_importer.py --mbox archive.mbox
+    python note_importer.py --slack slack_export/ --store jsonl
+    python note_importer.py --slack slack_export/general --output-dir notes/
+"""
+
+import argparse
+import json
+import re
+from datetime import datetime
+from email import policy
+from email.parser import BytesFeedParser
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from post_meeting_capture import PostMeetingCapture
+
+
+_SUBJECT_PREFIX = re.compile(r'^\s*((re|fwd?|fw)\s*:\s*)+', re.IGNORECASE)
+_NON_SLUG = re.compile(r'[^a-z0-9]+')
+_MBOX_ESCAPED_FROM = re.compile(rb'^>+From ')
+
+
+def _slug(text: str, max_len: int = 50) -> str:
+    """Lowercase underscore topic from a subject or channel name"""
+    return _NON_SLUG.sub('_', text.lower()).strip('_')[:max_len] or 'untitled'
+
+
+# ---------------------------------------------------------------------------
+# mbox
+# ---------------------------------------------------------------------------
+
+def iter_mbox_messages(path) -> Iterator:
+    """
+    Stream messages from an mbox file
+
+    Reads line by line and feeds each message to a BytesFeedParser, so only
+    one message is held in memory at a time (mailbox.mbox indexes the whole
+    file up front).
+    """
+    parser = None
+    prev_blank = True
+
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.startswith(b'From ') and prev_blank:
+                if parser is not None:
+                    yield parser.close()
+                parser = BytesFeedParser(policy=policy.default)
+                prev_blank = False
+                continue
+
+            if parser is not None:
+                # mboxrd: ">From " -> "From " (one level of quoting removed)
+                if _MBOX_ESCAPED_FROM.match(line):
+                    line = line[1:]
+                parser.feed(line)
+
+            prev_blank = line in (b'\n', b'\r\n')
+
+    if parser is not None:
+        yield parser.close()
+
+
+def message_text(msg) -> str:
+    """Plain-text body of an email message (falls back to stripped HTML)"""
+    body = msg.get_body(preferencelist=('plain', 'html'))
+    if body is None:
+        return ''
+    try:
+        text = body.get_content()
+    except (LookupError, UnicodeDecodeError):
+        text = body.get_payload(decode=True).decode('utf-8', errors='replace')
+    if body.get_content_subtype() == 'html':
+        text = re.sub(r'<[^>]+>', ' ', text)
+    return text.strip()
+
+
+def email_to_item(msg) -> Optional[Dict]:
+    """Convert an email message to a capture item"""
+    content = message_text(msg)
+    if not content:
+        return None
+
+    subject = _SUBJECT_PREFIX.sub('', str(msg.get('subject', '') or ''))
+    try:
+        captured_at = parsedate_to_datetime(msg['date']) if msg['date'] else None
+    except (TypeError, ValueError):
+        captured_at = None
+    if captured_at is not None and captured_at.tzinfo is not None:
+        captured_at = captured_at.astimezone().replace(tzinfo=None)
+
+    return {
+        'topic': _slug(subject) if subject.strip() else None,
+        'source_type': 'email',
+        'recipient': str(msg.get('to', '') or '') or None,
+        'sender': str(msg.get('from', '') or ''),
+        'captured_at': captured_at,
+        'content': content
+    }
+
+
+# ---------------------------------------------------------------------------
+# Slack export
+# ---------------------------------------------------------------------------
+
+def iter_slack_messages(path) -> Iterator[Tuple[str, Dict]]:
+    """
+    Yield (channel, message) from a Slack export
+
+    Accepts the export root (channel dirs of per-day JSON files), a single
+    channel directory, or a single JSON file holding a message list.
+    """
+    path = Path(path)
+
+    if path.is_file():
+        with open(path, 'r') as f:
+            for message in json.load(f):
+                yield path.stem, message
+        return
+
+    day_files = sorted(path.glob('*.json'))
+    if day_files and any(p.name[:4].isdigit() for p in day_files):
+        channel_dirs = [path]
+    else:
+        # Export root: users.json/channels.json at top, one dir per channel
+        channel_dirs = sorted(p for p in path.iterdir() if p.is_dir())
+
+    for channel_dir in channel_dirs:
+        for day_file in sorted(channel_dir.glob('*.json')):
+            with open(day_file, 'r') as f:
+                messages = json.load(f)
+            for message in messages:
+                yield channel_dir.name, message
+
+
+def slack_to_item(channel: str, message: Dict) -> Optional[Dict]:
+    """Convert a Slack message to a capture item"""
+    text = (message.get('text') or '').strip()
+    if not text or message.get('subtype') in ('channel_join', 'channel_leave', 'bot_add'):
+        return None
+
+    try:
+        captured_at = datetime.fromtimestamp(float(message['ts']))
+    except (KeyError, TypeError, ValueError):
+        captured_at = None
+
+    return {
+        'topic': _slug(channel),
+        'source_type': 'slack',
+        'recipient': f"#{channel}",
+        'sender': message.get('user_name') or (message.get('user_profile') or {}).get('real_name')
+                  or message.get('user', ''),
+        'captured_at': captured_at,
+        'content': text
+    }
+
+
+# ---------------------------------------------------------------------------
+# Routing + batched write
+# ---------------------------------------------------------------------------
+
+def route_items(items: Iterable[Optional[Dict]], max_open: int = 1000) -> Iterator[Dict]:
+    """
+    Merge items into one note per (date, topic), messages in arrival order
+
+    Notes are yielded once complete: pending notes are flushed when the
+    date moves on (exports are chronological) or when max_open notes are
+    pending, so memory stays bounded. A topic that comes back after its
+    note was flushed starts a new note.
+    """
+    notes: Dict[Tuple[str, str], Dict] = {}
+    current_day = None
+    now = datetime.now()
+
+    for item in items:
+        if item is None:
+            continue
+        captured_at = item['captured_at'] or now
+        topic = item['topic'] or _slug(' '.join(item['content'].split()[:3]))
+        day = captured_at.strftime('%Y-%m-%d')
+        key = (day, topic)
+
+        if day != current_day or (key not in notes and len(notes) >= max_open):
+            yield from _flush_notes(notes)
+            current_day = day
+
+        line = item['content']
+        if item.get('sender'):
+            line = f"**{item['sender']}** ({captured_at.strftime('%H:%M')}): {line}"
+
+        note = notes.get(key)
+        if note is None:
+            notes[key] = {
+                'topic': topic,
+                'source_type': item['source_type'],
+                'recipient': item['recipient'],
+                'captured_at': captured_at,
+                'parts': [line]
+            }
+        else:
+            note['parts'].append(line)
+
+    yield from _flush_notes(notes)
+
+
+def _flush_notes(notes: Dict[Tuple[str, str], Dict]) -> Iterator[Dict]:
+    """Join and yield pending notes, emptying the dict"""
+    for note in notes.values():
+        parts = note.pop('parts')
+        note['content'] = "\n\n".join(parts)
+        yield note
+    notes.clear()
+
+
+def import_items(capture: PostMeetingCapture, items: Iterable[Optional[Dict]],
+                 batch_size: int = 1000) -> List[str]:
+    """Route items to notes and write them through capture_many, batch_size notes at a time"""
+    filenames, batch = [], []
+    for note in route_items(items, max_open=batch_size):
+        batch.append(note)
+        if len(batch) >= batch_size:
+            filenames.extend(capture.capture_many(batch))
+            batch = []
+    if batch:
+        filenames.extend(capture.capture_many(batch))
+    return filenames
+
+
+def import_mbox(capture: PostMeetingCapture, path, batch_size: int = 1000) -> List[str]:
+    return import_items(capture, (email_to_item(m) for m in iter_mbox_messages(path)), batch_size)
+
+
+def import_slack(capture: PostMeetingCapture, path, batch_size: int = 1000) -> List[str]:
+    return import_items(capture, (slack_to_item(c, m) for c, m in iter_slack_messages(path)), batch_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Bulk import notes from mbox or Slack export files"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--mbox', type=str, help="mbox file to import")
+    source.add_argument('--slack', type=str, help="Slack export directory, channel directory, or JSON file")
+    parser.add_argument(
+        '--output-dir', '-o',
+        type=str,
+        help="Output directory (default: HCSS meetings folder)"
+    )
+    parser.add_argument(
+        '--store',
+        choices=['json', 'jsonl'],
+        default='jsonl',
+        help="Structured store (default: append-only notes.jsonl)"
+    )
+    parser.add_argument('--batch-size', type=int, default=1000, help="Notes per write batch")
+    args = parser.parse_args()
+
+    capture = PostMeetingCapture(output_dir=args.output_dir, store=args.store)
+
+    if args.mbox:
+        filenames = import_mbox(capture, args.mbox, args.batch_size)
+    else:
+        filenames = import_slack(capture, args.slack, args.batch_size)
+
+    print(f"✅ Imported {len(filenames)} notes into {capture.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
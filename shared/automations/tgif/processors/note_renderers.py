@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Post-Meeting Note Renderers
+
+Output formats for PostMeetingCapture. Each renderer takes a batch of
+notes and writes them in one pass:
+
+- MarkdownRenderer  - one .md file per note (pre-compiled template)
+- JsonRenderer      - one .json file per note (structured access)
+- JsonlStore        - append-only notes.jsonl (one line per note)
+
+A note is a dict with: filename, topic, source_type, recipient,
+content, captured_at (datetime).
+"""
+
+import json
+from pathlib import Path
+from string import Template
+
+
+# Compiled once at import; values are substituted, never re-parsed
+NOTE_TEMPLATE = Template("""# ${title} - Post-Meeting Notes
+
+**Date:** ${date}  
+**Type:** ${source_type}  
+**Source:** ${recipient}  
+**Context:** Post-meeting operational update
+
+---
+
+## Status Update
+
+${content}
+
+---
+
+## Context Notes
+
+**Why This Matters:**
+Operational details not captured in formal meeting transcripts.
+
+**Preservation Reason:**
+Real-time status update for stakeholders.
+
+---
+
+*Captured via post_meeting_capture.py - preserving operational context*
+""")
+
+
+class MarkdownRenderer:
+    """One markdown file per note"""
+
+    name = 'markdown'
+
+    def render(self, note: dict) -> str:
+        return NOTE_TEMPLATE.substitute(
+            title=(note.get('topic') or 'Status Update').replace('_', ' ').title(),
+            date=note['captured_at'].strftime("%Y-%m-%d"),
+            source_type=note.get('source_type') or 'text',
+            recipient=note.get('recipient') or 'N/A',
+            content=note['content']
+        )
+
+    def write_many(self, output_dir: Path, notes: list):
+        for note in notes:
+            with open(output_dir / note['filename'], 'w') as f:
+                f.write(self.render(note))
+
+
+def note_record(note: dict) -> dict:
+    """Structured JSON record for a note"""
+    return {
+        'date': note['captured_at'].isoformat(),
+        'filename': note['filename'],
+        'metadata': {
+            'topic': note.get('topic'),
+            'source_type': note.get('source_type'),
+            'recipient': note.get('recipient')
+        },
+        'content': note['content']
+    }
+
+
+class JsonRenderer:
+    """One JSON file per note, next to its markdown"""
+
+    name = 'json'
+
+    def write_many(self, output_dir: Path, notes: list):
+        for note in notes:
+            json_path = (output_dir / note['filename']).with_suffix('.json')
+            with open(json_path, 'w') as f:
+                json.dump(note_record(note), f, indent=2)
+
+
+class JsonlStore:
+    """Append-only JSON Lines store; a whole batch is one open + one write"""
+
+    name = 'jsonl'
+
+    def __init__(self, filename: str = 'notes.jsonl'):
+        self.filename = filename
+
+    def write_many(self, output_dir: Path, notes: list):
+        lines = "".join(json.dumps(note_record(note)) + "\n" for note in notes)
+        with open(output_dir / self.filename, 'a') as f:
+            f.write(lines)
+
+    def iter_records(self, output_dir: Path):
+        """Read back stored notes"""
+        path = Path(output_dir) / self.filename
+        if not path.exists():
+            return
+        with open(path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def default_renderers(store: str = 'json') -> list:
+    """Markdown plus the structured store ('json' per-note files or 'jsonl' append-only)"""
+    if store == 'jsonl':
+        return [MarkdownRenderer(), JsonlStore()]
+    if store == 'json':
+        return [MarkdownRenderer(), JsonRenderer()]
+    raise ValueError(f"Unknown note store: {store} (expected 'json' or 'jsonl')")
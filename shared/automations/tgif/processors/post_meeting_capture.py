@@ -9,28 +9,35 @@ Usage:
     python post_meeting_capture.py --interactive
     python post_meeting_capture.py --text "Your status update here"
     python post_meeting_capture.py --from-clipboard
+    python post_meeting_capture.py --text "..." --store jsonl
 """
 
-import os
-import sys
-import json
+# Launched from hotkeys many times a day: keep module-level imports to the
+# minimum needed for argument parsing (see benchmarks/startup_budget.py).
+# subprocess and the renderers are imported when first used.
 from datetime import datetime
 from pathlib import Path
 import argparse
-import subprocess
 
 
 class PostMeetingCapture:
     """Capture and save post-meeting operational notes"""
     
-    def __init__(self, output_dir=None):
+    def __init__(self, output_dir=None, store='json', renderers=None):
         if output_dir is None:
             # Default to HCSS meetings folder
             base = Path.home() / "Hammer Consulting Dropbox/Justin Harmon/Public/8825"
             output_dir = base / "8825_files/HCSS/meetings/post_meeting_notes"
         
+        # Directory is created on first write, not on startup
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._output_ready = False
+        
+        # Markdown + structured store ('json' per note, or 'jsonl' append-only)
+        if renderers is None:
+            from note_renderers import default_renderers
+            renderers = default_renderers(store)
+        self.renderers = renderers
     
     def capture_interactive(self):
         """Interactive mode - prompt for details"""
@@ -56,38 +63,69 @@ class PostMeetingCapture:
         content = "\n".join(lines)
         
         # Save
-        filename = self._generate_filename(topic)
+        now = datetime.now()
+        filename = self._generate_filename(topic, now)
         self._save_note(filename, {
             'topic': topic,
             'source_type': source_type,
             'recipient': recipient,
             'content': content
-        })
+        }, now)
         
         print(f"\n✅ Saved to: {filename}")
     
     def capture_text(self, text, topic=None, source_type="text"):
         """Capture from text string"""
         if not topic:
-            # Auto-generate topic from first few words
-            words = text.split()[:3]
-            topic = "_".join(words).lower()
-            topic = "".join(c for c in topic if c.isalnum() or c == "_")
+            topic = self._topic_from_text(text)
         
-        filename = self._generate_filename(topic)
+        now = datetime.now()
+        filename = self._generate_filename(topic, now)
         self._save_note(filename, {
             'topic': topic,
             'source_type': source_type,
             'content': text
-        })
+        }, now)
         
         print(f"✅ Saved to: {filename}")
         return filename
     
+    def capture_many(self, items, source_type="text") -> list:
+        """
+        Capture many notes in one pass (bulk import of Slack/email messages)
+        
+        Args:
+            items: Dicts with 'content' and optional 'topic', 'source_type',
+                   'recipient', 'captured_at' (datetime, defaults to now)
+            source_type: Default source type for items without one
+        
+        Returns:
+            List of saved filenames
+        """
+        batch_now = datetime.now()
+        notes = []
+        taken = set()
+        
+        for item in items:
+            now = item.get('captured_at') or batch_now
+            topic = item.get('topic') or self._topic_from_text(item['content'])
+            notes.append({
+                'filename': self._generate_filename(topic, now, taken),
+                'topic': topic,
+                'source_type': item.get('source_type') or source_type,
+                'recipient': item.get('recipient'),
+                'content': item['content'],
+                'captured_at': now
+            })
+        
+        self._write_notes(notes)
+        return [note['filename'] for note in notes]
+    
     def capture_from_clipboard(self):
         """Capture from clipboard"""
         try:
             # Try to get clipboard content (macOS)
+            import subprocess
             result = subprocess.run(['pbpaste'], capture_output=True, text=True)
             content = result.stdout
             
@@ -109,64 +147,46 @@ class PostMeetingCapture:
             print(f"❌ Error reading clipboard: {e}")
             return None
     
-    def _generate_filename(self, topic):
-        """Generate filename with date and topic"""
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        safe_topic = "".join(c for c in topic if c.isalnum() or c == "_")
-        return f"{date_str}_{safe_topic}.md"
+    def _topic_from_text(self, text):
+        """Auto-generate topic from first few words"""
+        words = text.split()[:3]
+        topic = "_".join(words).lower()
+        return "".join(c for c in topic if c.isalnum() or c == "_")
     
-    def _save_note(self, filename, data):
-        """Save note to markdown file"""
-        filepath = self.output_dir / filename
-        
-        # Build markdown content
-        md_content = f"""# {data.get('topic', 'Status Update').replace('_', ' ').title()} - Post-Meeting Notes
-
-**Date:** {datetime.now().strftime("%Y-%m-%d")}  
-**Type:** {data.get('source_type', 'text')}  
-**Source:** {data.get('recipient', 'N/A')}  
-**Context:** Post-meeting operational update
-
----
-
-## Status Update
-
-{data['content']}
-
----
-
-## Context Notes
-
-**Why This Matters:**
-Operational details not captured in formal meeting transcripts.
-
-**Preservation Reason:**
-Real-time status update for stakeholders.
-
----
-
-*Captured via post_meeting_capture.py - preserving operational context*
-"""
-        
-        # Write file
-        with open(filepath, 'w') as f:
-            f.write(md_content)
+    def _generate_filename(self, topic, now=None, taken=None):
+        """
+        Generate filename with date and topic
         
-        # Also save JSON version for structured access
-        json_path = filepath.with_suffix('.json')
-        json_data = {
-            'date': datetime.now().isoformat(),
+        A name already on disk (or in `taken`, the names used so far in this
+        batch) gets a _2, _3, ... suffix instead of overwriting that note.
+        """
+        date_str = (now or datetime.now()).strftime("%Y-%m-%d")
+        safe_topic = "".join(c for c in topic if c.isalnum() or c == "_")
+        base = f"{date_str}_{safe_topic}"
+        filename = f"{base}.md"
+        n = 1
+        while (taken is not None and filename in taken) or (self.output_dir / filename).exists():
+            n += 1
+            filename = f"{base}_{n}.md"
+        if taken is not None:
+            taken.add(filename)
+        return filename
+    
+    def _save_note(self, filename, data, now=None):
+        """Save note through each renderer (markdown + structured store)"""
+        self._write_notes([{
+            **data,
             'filename': filename,
-            'metadata': {
-                'topic': data.get('topic'),
-                'source_type': data.get('source_type'),
-                'recipient': data.get('recipient')
-            },
-            'content': data['content']
-        }
-        
-        with open(json_path, 'w') as f:
-            json.dump(json_data, f, indent=2)
+            'captured_at': now or datetime.now()
+        }])
+    
+    def _write_notes(self, notes: list):
+        """Write a batch of notes; each renderer handles the batch in one pass"""
+        if not self._output_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_ready = True
+        for renderer in self.renderers:
+            renderer.write_many(self.output_dir, notes)
     
     def list_recent(self, days=7):
         """List recent post-meeting notes"""
@@ -224,11 +244,17 @@ def main():
         type=str,
         help="Output directory (default: HCSS meetings folder)"
     )
+    parser.add_argument(
+        '--store',
+        choices=['json', 'jsonl'],
+        default='json',
+        help="Structured store: one JSON per note, or append-only notes.jsonl"
+    )
     
     args = parser.parse_args()
     
     # Create capture instance
-    capture = PostMeetingCapture(output_dir=args.output_dir)
+    capture = PostMeetingCapture(output_dir=args.output_dir, store=args.store)
     
     # Handle commands
     if args.list:
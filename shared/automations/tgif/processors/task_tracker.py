@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Task Tracker Store
+
+Keeps focuses/hcss/knowledge/task_tracker.json without recomputing its
+metadata block on every change:
+
+- by_status / by_owner / by_priority counters updated incrementally (O(1))
+- open tasks indexed by due date (sorted list + bisect) for overdue counts
+- changes appended to task_tracker.log.jsonl; the JSON snapshot is only
+  rewritten on compaction (every N changes, or on demand)
+
+The snapshot keeps the existing task_tracker.json format, so other
+readers of the file keep working. Single writer per file.
+
+Usage:
+    python task_tracker.py add "Send vendor contract" --who Alex --due 2025-11-20 --priority high
+    python task_tracker.py complete ACT-2025-11-13-MANUAL-001
+    python task_tracker.py list --overdue
+    python task_tracker.py stats
+    python task_tracker.py compact
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+DEFAULT_TASK_TRACKER = Path(__file__).resolve().parent.parent / "focuses/hcss/knowledge/task_tracker.json"
+
+CLOSED_STATUSES = {'done', 'cancelled'}
+TASK_FIELDS = ('what', 'who', 'due', 'priority', 'source', 'status')
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def content_hash(what: str, who: Optional[str] = None) -> str:
+    """Dedup key: owner + normalized task text"""
+    normalized = _WHITESPACE.sub(' ', what.strip().lower()).rstrip('.')
+    return hashlib.sha1(f"{(who or '').lower()}|{normalized}".encode('utf-8')).hexdigest()[:16]
+
+
+class TaskStore:
+    """Task tracker with incremental rollups and an append-only change log"""
+
+    def __init__(self, path=None, compact_every: int = 500):
+        self.path = Path(path) if path else DEFAULT_TASK_TRACKER
+        self.log_path = self.path.with_name(self.path.stem + ".log.jsonl")
+        self.compact_every = compact_every
+
+        self.tasks: Dict[str, Dict] = {}
+        self.by_status = Counter()
+        self.by_owner = Counter()
+        self.by_priority = Counter()
+        self._due_index: List[tuple] = []   # (due, id) for open tasks with a due date
+        self._id_seq: Dict[str, int] = {}   # "ACT-YYYY-MM-DD-SOURCE" -> last number
+        self._by_hash: Dict[str, str] = {}  # content hash -> id
+        self._log_entries = 0
+        self.last_updated = None
+
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        if self.path.exists():
+            with open(self.path, 'r') as f:
+                snapshot = json.load(f)
+            for task in snapshot.get('tasks', []):
+                self._index(task)
+            self.last_updated = snapshot.get('metadata', {}).get('last_updated')
+
+        if self.log_path.exists():
+            with open(self.log_path, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        self._replay(json.loads(line))
+                        self._log_entries += 1
+
+    def _replay(self, entry: Dict):
+        """
+        Apply one log entry on top of the snapshot
+
+        Idempotent: if compact() stopped after replacing the snapshot but
+        before removing the log, its adds are already in the snapshot and are
+        skipped, and its updates just set the same fields again.
+        """
+        if entry['op'] == 'add':
+            if entry['task']['id'] not in self.tasks:
+                self._index(entry['task'])
+        elif entry['op'] == 'update':
+            self._apply_update(entry['id'], entry['fields'])
+        self.last_updated = entry['at']
+
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
+
+    def _index(self, task: Dict):
+        self.tasks[task['id']] = task
+        self._count(task, 1)
+        self._track_id(task['id'])
+        self._by_hash.setdefault(task.get('content_hash') or content_hash(task['what'], task.get('who')),
+                                 task['id'])
+
+    def _count(self, task: Dict, delta: int):
+        """Add (delta=1) or remove (delta=-1) a task from counters and due index"""
+        for counter, key in ((self.by_status, task.get('status')),
+                             (self.by_owner, task.get('who')),
+                             (self.by_priority, task.get('priority'))):
+            if key is None:
+                continue
+            counter[key] += delta
+            if counter[key] <= 0:
+                del counter[key]
+
+        if task.get('due') and task.get('status') not in CLOSED_STATUSES:
+            entry = (task['due'], task['id'])
+            if delta > 0:
+                insort(self._due_index, entry)
+            else:
+                i = bisect_left(self._due_index, entry)
+                if i < len(self._due_index) and self._due_index[i] == entry:
+                    del self._due_index[i]
+
+    def _track_id(self, task_id: str):
+        prefix, _, number = task_id.rpartition('-')
+        if number.isdigit():
+            self._id_seq[prefix] = max(self._id_seq.get(prefix, 0), int(number))
+
+    def _apply_update(self, task_id: str, fields: Dict):
+        task = self.tasks[task_id]
+        # Snapshot tasks written before content hashes have none stored
+        old_hash = task.get('content_hash') or content_hash(task['what'], task.get('who'))
+        self._count(task, -1)
+        task.update(fields)
+        self._count(task, 1)
+
+        if 'what' in fields or 'who' in fields:
+            if self._by_hash.get(old_hash) == task_id:
+                del self._by_hash[old_hash]
+            task['content_hash'] = content_hash(task['what'], task.get('who'))
+            self._by_hash[task['content_hash']] = task_id
+
+    # ------------------------------------------------------------------
+    # Change log
+    # ------------------------------------------------------------------
+
+    def _append_log(self, entries: List[Dict]):
+        """Append change entries in one write, compacting when the log grows"""
+        if not entries:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, 'a') as f:
+            f.write("".join(json.dumps(e) + "\n" for e in entries))
+        self._log_entries += len(entries)
+        self.last_updated = entries[-1]['at']
+
+        if self.compact_every and self._log_entries >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """Rewrite task_tracker.json from memory and truncate the change log"""
+        today = date.today().isoformat()
+        tasks = []
+        for task in self.tasks.values():
+            task['overdue'] = self._is_overdue(task, today)
+            tasks.append(task)
+
+        snapshot = {'tasks': tasks, 'metadata': self.metadata(today)}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(snapshot, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+        if self.log_path.exists():
+            self.log_path.unlink()
+        self._log_entries = 0
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def new_id(self, source: str = 'manual', on: Optional[str] = None) -> str:
+        """Next ACT-YYYY-MM-DD-SOURCE-NNN id"""
+        prefix = f"ACT-{on or date.today().isoformat()}-{source.upper()}"
+        number = self._id_seq.get(prefix, 0) + 1
+        self._id_seq[prefix] = number
+        return f"{prefix}-{number:03d}"
+
+    def _new_task(self, what: str, who: Optional[str] = None, due: Optional[str] = None,
+                  priority: str = 'medium', source: str = 'manual', status: str = 'todo',
+                  task_id: Optional[str] = None, **extra) -> Dict:
+        now = datetime.now().isoformat()
+        task = {
+            'what': what,
+            'who': who,
+            'due': due,
+            'priority': priority,
+            'source': source,
+            **extra,
+            'content_hash': content_hash(what, who),
+            'id': task_id or self.new_id(source),
+            'created_at': now,
+            'updated_at': now,
+            'status': status,
+            'overdue': False
+        }
+        task['overdue'] = self._is_overdue(task, date.today().isoformat())
+        return task
+
+    def add(self, what: str, **fields) -> Dict:
+        """Add a task (fields: who, due, priority, source, status, task_id, ...)"""
+        return self.add_many([dict(fields, what=what)])[0]
+
+    def add_many(self, items: Iterable[Dict]) -> List[Dict]:
+        """Add tasks in one log write"""
+        tasks, entries = [], []
+        for item in items:
+            task = self._new_task(**item)
+            if task['id'] in self.tasks:
+                raise ValueError(f"Task already exists: {task['id']}")
+            self._index(task)
+            tasks.append(task)
+            entries.append({'op': 'add', 'task': task, 'at': task['created_at']})
+        self._append_log(entries)
+        return tasks
+
+    def _update_entry(self, task_id: str, fields: Dict) -> Dict:
+        """Apply an update in memory and return its log entry"""
+        if task_id not in self.tasks:
+            raise KeyError(f"Unknown task: {task_id}")
+        unknown = set(fields) - set(TASK_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown task fields: {', '.join(sorted(unknown))}")
+
+        fields['updated_at'] = datetime.now().isoformat()
+        self._apply_update(task_id, fields)
+        return {'op': 'update', 'id': task_id, 'fields': fields, 'at': fields['updated_at']}
+
+    def update(self, task_id: str, **fields) -> Dict:
+        """Update task fields; counters and due index follow incrementally"""
+        self._append_log([self._update_entry(task_id, fields)])
+        return self.tasks[task_id]
+
+    def upsert_many(self, items: Iterable[Dict], id_date: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """
+        Add new tasks / refresh existing ones, deduplicated by content hash
+
+        Existing tasks only take a new due date or priority when the item
+        provides one; status is never reset. All changes are one log write.
+
+        Args:
+            items: Dicts with 'what' and optional who/due/priority/source
+            id_date: Date used in new ACT-... ids (default: today)
+
+        Returns:
+            {'added': [...], 'updated': [...], 'unchanged': [...]}
+        """
+        result = {'added': [], 'updated': [], 'unchanged': []}
+        entries = []
+
+        for item in items:
+            item = {k: v for k, v in item.items() if k in TASK_FIELDS}
+            key = content_hash(item['what'], item.get('who'))
+            task_id = self._by_hash.get(key)
+
+            if task_id is None:
+                source = item.get('source', 'manual')
+                task = self._new_task(task_id=self.new_id(source, on=id_date), **item)
+                self._index(task)
+                entries.append({'op': 'add', 'task': task, 'at': task['created_at']})
+                result['added'].append(task)
+                continue
+
+            task = self.tasks[task_id]
+            changes = {f: item[f] for f in ('due', 'priority') if item.get(f) and item[f] != task.get(f)}
+            if changes:
+                entries.append(self._update_entry(task_id, changes))
+                result['updated'].append(task)
+            else:
+                result['unchanged'].append(task)
+
+        self._append_log(entries)
+        return result
+
+    def complete(self, task_id: str) -> Dict:
+        return self.update(task_id, status='done')
+
+    def _is_overdue(self, task: Dict, today: str) -> bool:
+        return bool(task.get('due')) and task['due'] < today and task.get('status') not in CLOSED_STATUSES
+
+    def overdue(self, today: Optional[str] = None) -> List[Dict]:
+        """Open tasks due before today, earliest first"""
+        end = bisect_left(self._due_index, (today or date.today().isoformat(),))
+        return [self.tasks[task_id] for _, task_id in self._due_index[:end]]
+
+    def overdue_count(self, today: Optional[str] = None) -> int:
+        return bisect_left(self._due_index, (today or date.today().isoformat(),))
+
+    def metadata(self, today: Optional[str] = None) -> Dict:
+        """Metadata block in task_tracker.json format, from the live counters"""
+        return {
+            'last_updated': self.last_updated or datetime.now().isoformat(),
+            'total_tasks': len(self.tasks),
+            'overdue_count': self.overdue_count(today),
+            'by_status': dict(self.by_status),
+            'by_owner': dict(self.by_owner),
+            'by_priority': dict(self.by_priority)
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Task tracker store")
+    parser.add_argument('--file', '-f', help="task_tracker.json path (default: HCSS knowledge)")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    add = sub.add_parser('add', help="Add a task")
+    add.add_argument('what')
+    add.add_argument('--who')
+    add.add_argument('--due', help="YYYY-MM-DD")
+    add.add_argument('--priority', default='medium', choices=['low', 'medium', 'high'])
+    add.add_argument('--source', default='manual')
+
+    complete = sub.add_parser('complete', help="Mark a task done")
+    complete.add_argument('task_id')
+
+    listing = sub.add_parser('list', help="List tasks")
+    listing.add_argument('--overdue', action='store_true', help="Only overdue tasks")
+
+    sub.add_parser('stats', help="Show metadata rollups")
+    sub.add_parser('compact', help="Rewrite snapshot and truncate change log")
+
+    args = parser.parse_args()
+    store = TaskStore(args.file)
+
+    if args.command == 'add':
+        task = store.add(args.what, who=args.who, due=args.due, priority=args.priority, source=args.source)
+        print(f"✅ Added {task['id']}: {task['what']}")
+    elif args.command == 'complete':
+        store.complete(args.task_id)
+        print(f"✅ Completed {args.task_id}")
+    elif args.command == 'list':
+        tasks = store.overdue() if args.overdue else list(store.tasks.values())
+        for task in tasks:
+            print(f"  [{task['status']}] {task['id']} {task['what']} "
+                  f"({task.get('who') or '-'}, due {task.get('due') or '-'})")
+        if not tasks:
+            print("  (none)")
+    elif args.command == 'stats':
+        print(json.dumps(store.metadata(), indent=2))
+    elif args.command == 'compact':
+        store.compact()
+        print(f"✅ Compacted {store.path}")
+
+
+if __name__ == "__main__":
+    main()
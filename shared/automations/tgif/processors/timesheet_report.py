@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Timesheet Report Pipeline
+
+Meeting metadata → per-client Word timesheets in one step.
+
+Reads the metadata JSON written by MinimalMeetingProcessor, builds the
+sections/table content in memory, and renders through the template
+generator. No intermediate content files.
+
+Usage:
+    python timesheet_report.py --template letterhead.docx --month 2025-11 --out timesheets/
+    python timesheet_report.py --template letterhead.docx --month 2025-11 --client-map clients.json
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from minimal_meeting_processor import DEFAULT_MEETINGS_DIR, DEFAULT_PROJECT, timesheet_entry
+
+# Template generator lives in tools/ at the repo root
+_GENERATOR_DIR = Path(__file__).resolve().parents[4] / "tools" / "template_word_generator"
+if str(_GENERATOR_DIR) not in sys.path:
+    sys.path.insert(0, str(_GENERATOR_DIR))
+
+
+def iter_month_metadata(metadata_dir: Path, month: str) -> Iterator[Dict]:
+    """
+    Yield meeting metadata for one month (YYYY-MM)
+
+    Metadata files are named YYYYMMDD_title.json, so other months are
+    skipped by filename without being opened.
+    """
+    prefix = month.replace('-', '')
+    for path in sorted(Path(metadata_dir).glob(f"{prefix}*.json")):
+        try:
+            with open(path, 'r') as f:
+                metadata = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️  Skipping {path.name}: {e}")
+            continue
+
+        if metadata.get('date', '').startswith(month):
+            yield metadata
+
+
+def resolve_client(metadata: Dict, client_map: Dict[str, str], default: str = DEFAULT_PROJECT) -> str:
+    """Client from metadata, else first title keyword match in client_map, else default"""
+    if metadata.get('client'):
+        return metadata['client']
+
+    title = metadata.get('title', '').lower()
+    for keyword, client in client_map.items():
+        if keyword.lower() in title:
+            return client
+
+    return default
+
+
+def group_entries_by_client(metadata_iter, client_map: Optional[Dict[str, str]] = None) -> Dict[str, List[Dict]]:
+    """Timesheet entries grouped by client, each list sorted by date"""
+    client_map = client_map or {}
+    by_client = defaultdict(list)
+
+    for metadata in metadata_iter:
+        if metadata.get('duration_minutes') is None:
+            continue
+        client = resolve_client(metadata, client_map)
+        entry = timesheet_entry({**metadata, 'client': client})
+        by_client[client].append(entry)
+
+    for entries in by_client.values():
+        entries.sort(key=lambda e: e['date'])
+
+    return dict(by_client)
+
+
+def build_timesheet_content(client: str, month: str, entries: List[Dict]) -> Dict:
+    """Build generator content dict (title, sections, table) for one client"""
+    month_label = datetime.strptime(month, '%Y-%m').strftime('%B %Y')
+    total_hours = round(sum(e['duration_hours'] for e in entries), 2)
+    billable_hours = round(sum(e['duration_hours'] for e in entries if e['billable']), 2)
+
+    rows = [["Date", "Meeting", "Attendees", "Hours"]]
+    for e in entries:
+        rows.append([e['date'], e['title'], ", ".join(e['attendees']), f"{e['duration_hours']:.2f}"])
+    rows.append(["", "Total", "", f"{total_hours:.2f}"])
+
+    safe_client = "".join(c if c.isalnum() else "_" for c in client).strip("_")
+
+    return {
+        'output_name': f"timesheet_{month}_{safe_client}",
+        'title': f"Timesheet - {client}",
+        'title_alignment': 'center',
+        'subtitle': month_label,
+        'sections': [
+            {
+                'heading': 'Summary',
+                'level': 1,
+                'bullets': [
+                    f"Meetings: {len(entries)}",
+                    f"Total hours: {total_hours:.2f}",
+                    f"Billable hours: {billable_hours:.2f}"
+                ]
+            },
+            {
+                'heading': 'Meetings',
+                'level': 1,
+                'table': {
+                    'rows': rows,
+                    'header': True,
+                    'widths': [1.0, 2.8, 1.9, 0.8]
+                }
+            }
+        ],
+        'footer': f"Generated from meeting metadata on {datetime.now().strftime('%Y-%m-%d')}"
+    }
+
+
+def generate_month_timesheets(template_path: str, month: str, outdir: str,
+                              metadata_dir: Optional[str] = None,
+                              client_map: Optional[Dict[str, str]] = None,
+                              workers: Optional[int] = None) -> List[Path]:
+    """Render one timesheet .docx per client for a month"""
+    from template_word_generator_v2 import generate_batch
+
+    metadata_dir = Path(metadata_dir) if metadata_dir else DEFAULT_MEETINGS_DIR / "metadata"
+    by_client = group_entries_by_client(iter_month_metadata(metadata_dir, month), client_map)
+
+    contents = [build_timesheet_content(client, month, entries)
+                for client, entries in sorted(by_client.items())]
+    if not contents:
+        return []
+
+    return generate_batch(template_path, contents, outdir, workers=workers)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate per-client Word timesheets from meeting metadata"
+    )
+    parser.add_argument('--template', '-t', required=True, help="Letterhead template .docx")
+    parser.add_argument('--month', '-m', default=datetime.now().strftime('%Y-%m'),
+                        help="Month as YYYY-MM (default: current month)")
+    parser.add_argument('--out', '-o', default='timesheets', help="Output directory")
+    parser.add_argument('--metadata-dir', help="Metadata directory (default: HCSS meetings/metadata)")
+    parser.add_argument('--client-map', help="JSON file mapping title keywords to client names")
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    try:
+        datetime.strptime(args.month, '%Y-%m')
+    except ValueError:
+        parser.error(f"--month must be YYYY-MM, got: {args.month}")
+
+    client_map = {}
+    if args.client_map:
+        with open(args.client_map, 'r') as f:
+            client_map = json.load(f)
+
+    outputs = generate_month_timesheets(
+        args.template, args.month, args.out,
+        metadata_dir=args.metadata_dir, client_map=client_map, workers=args.workers
+    )
+
+    if not outputs:
+        print(f"⚠️  No meetings found for {args.month}")
+        return
+
+    print(f"\n✅ Generated {len(outputs)} timesheets for {args.month}:")
+    for path in outputs:
+        print(f"   {path}")
+
+
+if __name__ == "__main__":
+    main()
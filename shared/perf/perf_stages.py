@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Perf Stages
+
+Opt-in per-stage instrumentation for the processors, Library and generator.
+Mark a stage with a decorator or a context manager:
+
+    from perf_stages import stage
+
+    @stage('processor.extract_metadata')
+    def _extract_metadata(...): ...
+
+    with stage('generator.save'):
+        doc.save(path)
+
+Nothing is measured unless PERF_STAGES is set; then a summary (calls, time,
+I/O bytes and, optionally, allocations per stage) is printed to stderr when
+the process exits:
+
+    PERF_STAGES=1                  time + I/O bytes (/proc/self/io, Linux)
+    PERF_STAGES=alloc              + tracemalloc (net allocated bytes per stage)
+    PERF_STAGES=profile            + cProfile (top functions by cumulative time)
+    PERF_STAGES=alloc,profile      both
+    PERF_REPORT=perf.json          also write the summary as JSON
+    PERF_PROFILE=run.prof          also dump raw cProfile stats (snakeviz, pstats)
+
+Stage times are inclusive (a stage nested in another counts in both). The
+report covers the current process only; generate_batch worker processes are
+not included.
+
+Disabled, `stage` hands back the function unchanged (or a shared no-op
+context), and only os/sys/time are imported - the CLIs' startup budget is
+unaffected (see benchmarks/startup_budget.py).
+"""
+
+import os
+import sys
+import time
+
+_MODES = {m.strip() for m in os.environ.get('PERF_STAGES', '').lower().split(',')} - {'', '0', 'off', 'false'}
+ENABLED = bool(_MODES)
+TRACE_ALLOC = 'alloc' in _MODES or 'all' in _MODES
+PROFILE = 'profile' in _MODES or 'all' in _MODES
+
+_IO_PATH = '/proc/self/io'
+_own_io_reads = 0  # bytes we read from /proc/self/io ourselves (not counted as stage I/O)
+_stats = {}        # name -> [calls, seconds, read bytes, write bytes, alloc bytes]
+_profiler = None
+_started = time.perf_counter()
+
+
+def _io_bytes():
+    """(read, write) bytes through read/write syscalls so far, or None"""
+    global _own_io_reads
+    try:
+        with open(_IO_PATH, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    fields = dict(line.split(b': ') for line in data.splitlines() if b': ' in line)
+    # The snapshot predates this read; earlier reads of it are subtracted
+    rchar = int(fields.get(b'rchar', 0)) - _own_io_reads
+    _own_io_reads += len(data)
+    return rchar, int(fields.get(b'wchar', 0))
+
+
+class _NullStage:
+    """Disabled stage: no-op context manager, identity decorator"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __call__(self, func):
+        return func
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """One measured stage; usable as context manager or decorator"""
+
+    __slots__ = ('name', '_start', '_io', '_mem')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self._io = _io_bytes()
+        self._mem = _tracemalloc.get_traced_memory()[0] if TRACE_ALLOC else 0
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._start
+        io_end = _io_bytes() if self._io is not None else None
+        entry = _stats.get(self.name)
+        if entry is None:
+            entry = _stats[self.name] = [0, 0.0, 0, 0, 0]
+        entry[0] += 1
+        entry[1] += elapsed
+        if io_end is not None:
+            entry[2] += io_end[0] - self._io[0]
+            entry[3] += io_end[1] - self._io[1]
+        if TRACE_ALLOC:
+            entry[4] += _tracemalloc.get_traced_memory()[0] - self._mem
+        return False
+
+    def __call__(self, func):
+        import functools
+        name = self.name
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def stage(name_or_func):
+    """
+    Mark a stage: @stage, @stage('name') or `with stage('name'):`
+
+    Bare @stage uses the function's qualified name.
+    """
+    if callable(name_or_func):
+        if not ENABLED:
+            return name_or_func
+        return _Stage(name_or_func.__qualname__)(name_or_func)
+    return _Stage(name_or_func) if ENABLED else _NULL_STAGE
+
+
+def summary():
+    """Per-stage totals collected so far (JSON-ready)"""
+    stages = {}
+    for name, (calls, seconds, read_bytes, write_bytes, alloc_bytes) in _stats.items():
+        stages[name] = {
+            'calls': calls,
+            'total_ms': round(seconds * 1000, 3),
+            'mean_ms': round(seconds * 1000 / calls, 3) if calls else None,
+            'read_bytes': read_bytes,
+            'write_bytes': write_bytes,
+        }
+        if TRACE_ALLOC:
+            stages[name]['alloc_bytes'] = alloc_bytes
+    return {
+        'pid': os.getpid(),
+        'argv': sys.argv,
+        'wall_ms': round((time.perf_counter() - _started) * 1000, 3),
+        'io_available': _io_bytes() is not None,
+        'stages': stages
+    }
+
+
+def _report():
+    """atexit: print the stage table to stderr (stdout may be a pipe or MCP transport)"""
+    if _profiler is not None:
+        _profiler.disable()
+
+    data = summary()
+    out = sys.stderr
+    program = os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else 'python'
+    print(f"\n⏱  Perf stages ({program}, wall {data['wall_ms']:.1f} ms)", file=out)
+    header = f"  {'stage':<40} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'read KB':>9} {'write KB':>9}"
+    if TRACE_ALLOC:
+        header += f" {'alloc KB':>9}"
+    print(header, file=out)
+    for name, s in sorted(data['stages'].items(), key=lambda item: -item[1]['total_ms']):
+        io = (f"{s['read_bytes'] / 1024:9.1f} {s['write_bytes'] / 1024:9.1f}"
+              if data['io_available'] else f"{'-':>9} {'-':>9}")
+        line = f"  {name:<40} {s['calls']:7d} {s['total_ms']:10.1f} {s['mean_ms']:9.3f} {io}"
+        if TRACE_ALLOC:
+            line += f" {s['alloc_bytes'] / 1024:9.1f}"
+        print(line, file=out)
+
+    report_path = os.environ.get('PERF_REPORT')
+    if report_path:
+        import json
+        with open(report_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        print(f"  JSON report: {report_path}", file=out)
+
+    if _profiler is not None:
+        import pstats
+        profile_path = os.environ.get('PERF_PROFILE')
+        if profile_path:
+            _profiler.dump_stats(profile_path)
+            print(f"  cProfile stats: {profile_path}", file=out)
+        print("\n  Top functions (cumulative):", file=out)
+        pstats.Stats(_profiler, stream=out).sort_stats('cumulative').print_stats(15)
+
+
+if ENABLED:
+    import atexit
+    atexit.register(_report)
+
+    if TRACE_ALLOC:
+        import tracemalloc as _tracemalloc
+        _tracemalloc.start()
+
+    if PROFILE:
+        import cProfile
+        _profiler = cProfile.Profile()
+        _profiler.enable()
@@ -4,43 +4,52 @@ Template-Based Word Document Generator V2
 Creates documents by copying template header and page setup, then adding new content
 """
 
-from docx import Document
-from docx.shared import Pt, RGBColor, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml import OxmlElement
+# docx/lxml are imported inside the functions that use them, so printing
+# usage or importing this module stays fast (see benchmarks/startup_budget.py)
 from pathlib import Path
+import copy
+import itertools
 import json
+import os
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Union
+
+# Opt-in stage timing (PERF_STAGES=1) from shared/perf; no-op stages outside the repo
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[2] / "shared" / "perf"))
+    from perf_stages import stage
+except (IndexError, ImportError):
+    _NULL_STAGE = type('NullStage', (), {'__enter__': lambda self: self, '__exit__': lambda self, *exc: None,
+                                         '__call__': lambda self, func: func})()
+    stage = lambda name: _NULL_STAGE  # noqa: E731  (with stage(...) / @stage(...))
+
+
+def _replace_children(part_element, elements):
+    """Replace children of a w:hdr/w:ftr with deep copies of elements
+    
+    Appending lxml nodes moves them, which would strip the source;
+    deep copies leave the source (or cached template) reusable.
+    """
+    for element in list(part_element):
+        part_element.remove(element)
+    for element in elements:
+        part_element.append(copy.deepcopy(element))
 
 
 def copy_header_footer(source_doc, target_doc):
     """Copy header and footer from source to target document"""
     try:
-        # Copy headers
         for section_idx, source_section in enumerate(source_doc.sections):
             if section_idx < len(target_doc.sections):
                 target_section = target_doc.sections[section_idx]
                 
                 # Copy header
                 if source_section.header:
-                    target_header = target_section.header
-                    # Clear existing header
-                    for element in list(target_header._element):
-                        target_header._element.remove(element)
-                    # Copy header content
-                    for element in source_section.header._element:
-                        target_header._element.append(element)
+                    _replace_children(target_section.header._element, source_section.header._element)
                 
-                # Copy footer  
+                # Copy footer
                 if source_section.footer:
-                    target_footer = target_section.footer
-                    # Clear existing footer
-                    for element in list(target_footer._element):
-                        target_footer._element.remove(element)
-                    # Copy footer content
-                    for element in source_section.footer._element:
-                        target_footer._element.append(element)
+                    _replace_children(target_section.footer._element, source_section.footer._element)
     except Exception as e:
         print(f"Warning: Could not copy headers/footers: {e}")
 
@@ -56,22 +65,204 @@ def copy_page_setup(source_doc, target_doc):
         target_section.bottom_margin = source_section.bottom_margin
 
 
-def generate_from_dict(template_path: str, content: Dict[str, Any], output_path: str) -> Path:
-    """Generate Word document from template and content dict"""
+# Element tags for the bulk table renderer, resolved once on first use
+_W: Dict[str, str] = {}
+
+
+def _w_tags() -> Dict[str, str]:
+    if not _W:
+        from docx.oxml.ns import qn
+        _W.update((tag, qn(f'w:{tag}')) for tag in (
+            'tbl', 'tblPr', 'tblW', 'tblStyle', 'tblLook', 'tblGrid', 'gridCol', 'tr', 'trPr', 'tblHeader',
+            'tc', 'tcPr', 'tcW', 'p', 'r', 'rPr', 'b', 't', 'br', 'tab', 'val', 'w', 'type',
+            'firstColumn', 'firstRow', 'lastColumn', 'lastRow', 'noHBand', 'noVBand'
+        ))
+    return _W
+_XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+_TWIPS_PER_INCH = 1440
+_EMU_PER_TWIP = 635
+
+
+def _add_cell_text(p, text: str, bold: bool, SubElement, _W):
+    """Append a run holding text to w:p (newlines become w:br, tabs w:tab)"""
+    r = SubElement(p, _W['r'])
+    if bold:
+        SubElement(SubElement(r, _W['rPr']), _W['b'])
+    
+    if '\n' not in text and '\t' not in text:
+        t = SubElement(r, _W['t'])
+        t.text = text
+        if text[:1].isspace() or text[-1:].isspace():
+            t.set(_XML_SPACE, 'preserve')
+        return
+    
+    for line_idx, line in enumerate(text.split('\n')):
+        if line_idx:
+            SubElement(r, _W['br'])
+        for part_idx, part in enumerate(line.split('\t')):
+            if part_idx:
+                SubElement(r, _W['tab'])
+            if part:
+                t = SubElement(r, _W['t'])
+                t.text = part
+                t.set(_XML_SPACE, 'preserve')
+
+
+@stage('generator.render_table')
+def render_table(doc, rows: Iterable[Iterable[Any]], header: bool = True,
+                 col_widths: Optional[List[float]] = None, style: Optional[str] = None):
+    """
+    Append a table built directly as w:tbl XML in one pass over rows
     
-    # Load template to get styles and setup
-    template_doc = Document(template_path)
+    Avoids python-docx cell proxies, which are slow for tables with
+    thousands of rows. Rows may be any iterable (e.g. a generator).
     
-    # Create new blank document
-    doc = Document()
+    Args:
+        doc: Target Document
+        rows: Row iterables; the first row fixes the column count
+        header: Bold the first row and repeat it on each page
+        col_widths: Column widths in inches, one per column (default: page width split evenly)
+        style: Table style name (ignored if missing from the document)
     
-    # Copy page setup from template
-    copy_page_setup(template_doc, doc)
+    Raises:
+        ValueError: A row has more cells than the first, or col_widths does not match it
     
-    # Copy header/footer from template
-    copy_header_footer(template_doc, doc)
+    Returns:
+        docx Table, or None if rows is empty
+    """
+    from docx.oxml import OxmlElement
+    from docx.table import Table
+    from lxml import etree
+    
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return None
+    first = list(first)
+    cols = len(first)
+    
+    if col_widths:
+        if len(col_widths) != cols:
+            raise ValueError(f"Table has {cols} columns but {len(col_widths)} col_widths")
+        widths = [str(int(w * _TWIPS_PER_INCH)) for w in col_widths]
+    else:
+        section = doc.sections[-1]
+        block_twips = (section.page_width - section.left_margin - section.right_margin) // _EMU_PER_TWIP
+        widths = [str(block_twips // cols)] * cols
+    
+    SubElement = etree.SubElement
+    _W = _w_tags()
+    tbl = OxmlElement('w:tbl')
+    tblPr = SubElement(tbl, _W['tblPr'])
+    if style:
+        try:
+            SubElement(tblPr, _W['tblStyle']).set(_W['val'], doc.styles[style].style_id)
+        except KeyError:
+            print(f"Warning: Table style not found: {style}")
+    tblW = SubElement(tblPr, _W['tblW'])
+    tblW.set(_W['type'], 'auto')
+    tblW.set(_W['w'], '0')
+    tblLook = SubElement(tblPr, _W['tblLook'])
+    for attr, value in (('firstColumn', '1'), ('firstRow', '1'), ('lastColumn', '0'),
+                        ('lastRow', '0'), ('noHBand', '0'), ('noVBand', '1'), ('val', '04A0')):
+        tblLook.set(_W[attr], value)
+    
+    tblGrid = SubElement(tbl, _W['tblGrid'])
+    for width in widths:
+        SubElement(tblGrid, _W['gridCol']).set(_W['w'], width)
+    
+    def add_row(row_data, bold):
+        cells = [str(value) for value in row_data]
+        if len(cells) > cols:
+            raise ValueError(f"Table row has {len(cells)} cells, expected {cols}")
+        cells.extend([''] * (cols - len(cells)))
+        
+        tr = SubElement(tbl, _W['tr'])
+        if bold:
+            SubElement(SubElement(tr, _W['trPr']), _W['tblHeader'])
+        for width, text in zip(widths, cells):
+            tc = SubElement(tr, _W['tc'])
+            tcW = SubElement(SubElement(tc, _W['tcPr']), _W['tcW'])
+            tcW.set(_W['type'], 'dxa')
+            tcW.set(_W['w'], width)
+            p = SubElement(tc, _W['p'])
+            if text:
+                _add_cell_text(p, text, bold, SubElement, _W)
+    
+    add_row(first, header)
+    for row_data in rows:
+        add_row(row_data, False)
+    
+    doc.element.body._insert_tbl(tbl)
+    return Table(tbl, doc._body)
+
+
+class CompiledTemplate:
+    """Template parsed once, with page setup and header/footer XML cached for reuse"""
+    
+    def __init__(self, template_path: str):
+        self.path = Path(template_path)
+        self.mtime_ns = self.path.stat().st_mtime_ns
+        
+        from docx import Document
+        source_doc = Document(str(self.path))
+        self.page_setup = [
+            (s.page_width, s.page_height, s.left_margin, s.right_margin, s.top_margin, s.bottom_margin)
+            for s in source_doc.sections
+        ]
+        # Detached copies of each section's w:hdr / w:ftr children; the
+        # source document can be released, and each target gets deep copies
+        self.headers = [[copy.deepcopy(e) for e in s.header._element] for s in source_doc.sections]
+        self.footers = [[copy.deepcopy(e) for e in s.footer._element] for s in source_doc.sections]
+    
+    def apply_to(self, target_doc):
+        """Copy cached page setup and header/footer into target document"""
+        for setup, target_section in zip(self.page_setup, target_doc.sections):
+            (target_section.page_width, target_section.page_height,
+             target_section.left_margin, target_section.right_margin,
+             target_section.top_margin, target_section.bottom_margin) = setup
+        
+        try:
+            for section_idx, target_section in enumerate(target_doc.sections):
+                if section_idx >= len(self.headers):
+                    break
+                _replace_children(target_section.header._element, self.headers[section_idx])
+                _replace_children(target_section.footer._element, self.footers[section_idx])
+        except Exception as e:
+            print(f"Warning: Could not copy headers/footers: {e}")
+    
+    def new_document(self):
+        """Create blank document with template page setup and header/footer"""
+        from docx import Document
+        doc = Document()
+        self.apply_to(doc)
+        return doc
+
+
+# Compiled templates keyed by (resolved path, mtime), so edits to a template are picked up
+_TEMPLATE_CACHE: Dict[tuple, CompiledTemplate] = {}
+
+
+@stage('generator.load_template')
+def load_template(template_path: str) -> CompiledTemplate:
+    """Return cached CompiledTemplate, recompiling if the file changed"""
+    path = Path(template_path).resolve()
+    key = (str(path), path.stat().st_mtime_ns)
+    
+    template = _TEMPLATE_CACHE.get(key)
+    if template is None:
+        # Drop stale versions of this template
+        for stale in [k for k in _TEMPLATE_CACHE if k[0] == key[0]]:
+            del _TEMPLATE_CACHE[stale]
+        template = _TEMPLATE_CACHE[key] = CompiledTemplate(path)
+    
+    return template
+
+
+def _add_front_matter(doc, content: Dict[str, Any]):
+    """Add title and subtitle"""
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
     
-    # Add title
     if 'title' in content:
         title = doc.add_heading(content['title'], 0)
         if 'title_alignment' in content:
@@ -80,7 +271,6 @@ def generate_from_dict(template_path: str, content: Dict[str, Any], output_path:
             elif content['title_alignment'] == 'right':
                 title.alignment = WD_ALIGN_PARAGRAPH.RIGHT
     
-    # Add subtitle
     if 'subtitle' in content:
         subtitle = doc.add_paragraph(content['subtitle'])
         subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -88,73 +278,241 @@ def generate_from_dict(template_path: str, content: Dict[str, Any], output_path:
             run.italic = True
     
     doc.add_paragraph()  # Spacing
+
+
+def _add_section(doc, section: Dict[str, Any]):
+    """Add one content section"""
+    # Section heading
+    if 'heading' in section:
+        level = section.get('level', 1)
+        doc.add_heading(section['heading'], level)
     
-    # Add sections
-    for section in content.get('sections', []):
-        # Section heading
-        if 'heading' in section:
-            level = section.get('level', 1)
-            doc.add_heading(section['heading'], level)
-        
-        # Paragraphs
-        for para_text in section.get('paragraphs', []):
-            doc.add_paragraph(para_text)
-        
-        # Bullet points
-        for bullet in section.get('bullets', []):
-            p = doc.add_paragraph()
-            p.add_run('• ' + bullet)
-        
-        # Numbered lists
-        for i, item in enumerate(section.get('numbered', []), 1):
-            doc.add_paragraph(f"{i}. {item}")
-        
-        # Tables
-        if 'table' in section:
-            table_data = section['table']
-            rows = table_data.get('rows', [])
-            
-            if rows:
-                cols = len(rows[0])
-                table = doc.add_table(rows=len(rows), cols=cols)
-                
-                # Populate table
-                for i, row_data in enumerate(rows):
-                    row_cells = table.rows[i].cells
-                    for j, cell_data in enumerate(row_data):
-                        row_cells[j].text = str(cell_data)
-                        
-                        # Bold header row
-                        if i == 0 and table_data.get('header', True):
-                            for paragraph in row_cells[j].paragraphs:
-                                for run in paragraph.runs:
-                                    run.font.bold = True
-            
-            doc.add_paragraph()  # Spacing after table
+    # Paragraphs
+    for para_text in section.get('paragraphs', []):
+        doc.add_paragraph(para_text)
+    
+    # Bullet points
+    for bullet in section.get('bullets', []):
+        p = doc.add_paragraph()
+        p.add_run('• ' + bullet)
+    
+    # Numbered lists
+    for i, item in enumerate(section.get('numbered', []), 1):
+        doc.add_paragraph(f"{i}. {item}")
+    
+    # Tables
+    if 'table' in section:
+        table_data = section['table']
+        render_table(
+            doc,
+            table_data.get('rows', []),
+            header=table_data.get('header', True),
+            col_widths=table_data.get('widths'),
+            style=table_data.get('style')
+        )
         
-        doc.add_paragraph()  # Spacing between sections
+        doc.add_paragraph()  # Spacing after table
+    
+    doc.add_paragraph()  # Spacing between sections
+
+
+def _add_closing(doc, content: Dict[str, Any]):
+    """Add footer text if provided"""
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
     
-    # Add footer if provided
     if 'footer' in content:
         doc.add_paragraph()
         footer = doc.add_paragraph(content['footer'])
         footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
         for run in footer.runs:
             run.italic = True
+
+
+def generate_from_stream(template_path: Union[str, CompiledTemplate], sections: Iterable[Dict[str, Any]],
+                         output_path: str, document: Optional[Dict[str, Any]] = None) -> Path:
+    """
+    Generate Word document, rendering sections as they arrive
+    
+    Sections are consumed one at a time, so the input never has to be
+    fully materialized (generators, JSON Lines readers, DB cursors).
+    
+    Args:
+        template_path: Template path or CompiledTemplate
+        sections: Iterable of section dicts (same shape as content['sections'])
+        output_path: Output .docx path
+        document: Document-level fields (title, subtitle, title_alignment, footer)
+    """
+    document = document or {}
+    
+    # Template is parsed once per path/mtime and reused across calls
+    if isinstance(template_path, CompiledTemplate):
+        template = template_path
+    else:
+        template = load_template(template_path)
+    
+    # New blank document with template page setup and header/footer
+    with stage('generator.render'):
+        doc = template.new_document()
+        
+        _add_front_matter(doc, document)
+        
+        for section in sections:
+            _add_section(doc, section)
+        
+        _add_closing(doc, document)
     
     # Save document
     output_path = Path(output_path)
-    doc.save(output_path)
+    with stage('generator.save'):
+        doc.save(output_path)
     
     return output_path
 
 
+@stage('generator.generate_from_dict')
+def generate_from_dict(template_path: Union[str, CompiledTemplate], content: Dict[str, Any],
+                       output_path: str) -> Path:
+    """Generate Word document from template (path or CompiledTemplate) and content dict"""
+    return generate_from_stream(template_path, content.get('sections', []), output_path, document=content)
+
+
+def read_jsonl_content(lines: Iterable[str]):
+    """
+    Parse JSON Lines content lazily
+    
+    Each line is one section. An optional first line {"document": {...}}
+    carries the title/subtitle/footer.
+    
+    Returns:
+        (document dict, iterator of sections)
+    """
+    def parse(line_iter):
+        for line_no, line in line_iter:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_no}: {e}") from e
+    
+    records = parse(enumerate(lines, 1))
+    first = next(records, None)
+    
+    if first is None:
+        return {}, iter(())
+    if 'document' in first:
+        return first['document'], records
+    return {}, itertools.chain([first], records)
+
+
+def _generate_one(args) -> str:
+    """Process pool worker: template is compiled once per worker via the cache"""
+    template_path, content, output_path = args
+    return str(generate_from_dict(template_path, content, output_path))
+
+
+def generate_batch(template: Union[str, CompiledTemplate], contents: Iterable[Dict[str, Any]],
+                   outdir: str, workers: Optional[int] = None) -> List[Path]:
+    """
+    Generate one document per content dict, fanned out across a process pool
+    
+    Args:
+        template: Template path or CompiledTemplate
+        contents: Content dicts; optional 'output_name' key sets the filename
+                  (repeated names get a _2, _3, ... suffix)
+        outdir: Output directory (created if missing)
+        workers: Process count (default: CPU count, 1 = in-process)
+    
+    Returns:
+        List of output paths, in input order
+    """
+    template_path = template.path if isinstance(template, CompiledTemplate) else Path(template)
+    outdir = Path(outdir)
+    outdir.mkdir(parents=True, exist_ok=True)
+    
+    jobs = []
+    taken = set()
+    for i, content in enumerate(contents, 1):
+        name = content.get('output_name') or f"document_{i:04d}"
+        if name.endswith('.docx'):
+            name = name[:-5]
+        # Repeated names (same content file twice, clients that sanitize alike)
+        # get _2, _3, ... instead of overwriting each other
+        filename, n = f"{name}.docx", 1
+        while filename.lower() in taken:
+            n += 1
+            filename = f"{name}_{n}.docx"
+        taken.add(filename.lower())
+        jobs.append((str(template_path), content, str(outdir / filename)))
+    
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+    
+    if workers <= 1:
+        if isinstance(template, CompiledTemplate):
+            return [generate_from_dict(template, content, out) for _, content, out in jobs]
+        return [Path(_generate_one(job)) for job in jobs]
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_template,
+                             initargs=(str(template_path),)) as pool:
+        return [Path(p) for p in pool.map(_generate_one, jobs, chunksize=chunksize)]
+
+
+def _main_batch(argv: List[str]):
+    """Batch mode: one template, many content files, one output directory"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog="template_word_generator_v2.py --batch",
+        description="Generate many documents from one template"
+    )
+    parser.add_argument('template', help="Template .docx")
+    parser.add_argument('outdir', help="Output directory")
+    parser.add_argument('content', nargs='+',
+                        help="Content JSON files (object, or list of objects)")
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    
+    contents = []
+    for content_path in args.content:
+        with open(content_path, 'r') as f:
+            data = json.load(f)
+        items = data if isinstance(data, list) else [data]
+        stem = Path(content_path).stem
+        for i, item in enumerate(items, 1):
+            if 'output_name' not in item:
+                item['output_name'] = stem if len(items) == 1 else f"{stem}_{i:04d}"
+            contents.append(item)
+    
+    outputs = generate_batch(args.template, contents, args.outdir, workers=args.workers)
+    
+    print(f"✅ Generated {len(outputs)} documents in {args.outdir}")
+    print(f"   Template: {args.template}")
+
+
 def main():
     """Command line interface"""
+    if len(sys.argv) > 1 and sys.argv[1] == '--batch':
+        try:
+            _main_batch(sys.argv[2:])
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
+        return
+    
     if len(sys.argv) < 4:
         print("Template-Based Word Document Generator V2")
         print("\nUsage:")
         print("  python3 template_word_generator_v2.py <template.docx> <content.json> <output.docx>")
+        print("  python3 template_word_generator_v2.py <template.docx> <content.jsonl|-> <output.docx>")
+        print("  python3 template_word_generator_v2.py --batch <template.docx> <outdir> <content.json>... [--workers N]")
         sys.exit(1)
     
     template_path = sys.argv[1]
@@ -162,10 +520,20 @@ def main():
     output_path = sys.argv[3]
     
     try:
-        with open(content_path, 'r') as f:
-            content = json.load(f)
-        
-        output = generate_from_dict(template_path, content, output_path)
+        if content_path == '-' or content_path.endswith('.jsonl'):
+            # Stream JSON Lines sections straight into the document
+            f = sys.stdin if content_path == '-' else open(content_path, 'r')
+            try:
+                document, sections = read_jsonl_content(f)
+                output = generate_from_stream(template_path, sections, output_path, document=document)
+            finally:
+                if f is not sys.stdin:
+                    f.close()
+        else:
+            with open(content_path, 'r') as f:
+                content = json.load(f)
+            
+            output = generate_from_dict(template_path, content, output_path)
         
         print(f"✅ Generated: {output}")
         print(f"   Template: {template_path}")